@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Optional, Union, Callable, Type, Literal, Generic
+from typing import Any, Optional, Union, Callable, Type, Literal, Generic, Iterable, Iterator
 from pathlib import Path
 import inspect
 
@@ -38,6 +38,8 @@ class OWidget(APIBaseWidget, ABC):
         ...
     def reload_config(self) -> Any:
         ...
+    def apply_config(self, diff: ConfigDiff) -> Any:
+        ...
     def save_status(self) -> LDT:
         ...
     def load_status(self, status: LDT) -> Any:
@@ -87,6 +89,8 @@ class OWindow(APIBaseWidget, ABC):
         ...
     def load_config(self) -> Any:
         ...
+    def apply_config(self, diff: ConfigDiff) -> Any:
+        ...
     def reload_config(self) -> Any:
         ...
     def save_status(self) -> LDT:
@@ -282,12 +286,17 @@ class Config(Generic[T]):
     _config_name: str = field(default='config')
     _scheme: Type[T] = field(default=None, repr=False)
     _config: T = field(init=False, repr=False)
+    _overrides: dict[str, Any] = field(init=False, factory=dict, repr=False)
+    _listeners: list[Any] = field(init=False, factory=list, repr=False)
     def __attrs_post_init__(self) -> Any:
         ...
     @staticmethod
     def getSchemeConfig(resource_type: str) -> Type[T]:
         ...
-    def _load_config(self) -> T:
+    @property
+    def url(self) -> Optional[str]:
+        ...
+    def _load_config(self, fresh: bool = False) -> T:
         ...
     @property
     def data(self) -> T:
@@ -298,12 +307,33 @@ class Config(Generic[T]):
     @property
     def type(self) -> str:
         ...
-    def reload(self) -> Any:
+    def override(self, **changes) -> Any:
+        ...
+    def subscribe(self, path: str, callback: Callable[[ConfigDiff], None]) -> Any:
+        ...
+    def unsubscribe(self, callback: Callable[[ConfigDiff], None]) -> Any:
+        ...
+    def reload(self) -> ConfigDiff:
         ...
     @classmethod
     def configApplication(cls) -> Config[AppConfig]:
         ...
 
+@define(frozen=True)
+class ConfigDiff:
+    """Fields changed by a reload as dotted paths (``settings.window.width``) -> (old, new).
+A field that appeared or disappeared has ``None`` on the missing side."""
+    changes: dict[str, tuple[Any, Any]] = field(factory=dict)
+    @classmethod
+    def between(cls, old: Optional[BaseConfig], new: BaseConfig) -> ConfigDiff:
+        ...
+    def __bool__(self) -> bool:
+        ...
+    def __iter__(self) -> Iterator[str]:
+        ...
+    def changed(self, *paths: str) -> bool:
+        ...
+
 class CLInterface:
     cliFunction: dict[str, Callable] = ...
     @staticmethod
@@ -363,6 +393,62 @@ def open_file_manager(path: Path) -> Any:
 def getSystem() -> list[str]:
     ...
 
+def overlay_open(file, mode = 'r', *args, **kwargs) -> Any:
+    """``open`` that understands plugin://, pldata://, project://, resource://, qt:// and other fs urls.
+Works without the global ``builtins.open`` patch of OpenManager; other paths go to the real open."""
+    ...
+
+def read_many(url: str, patterns: Iterable[str]) -> dict[str, Union[memoryview, bytes]]:
+    """Files of the folder ``url`` matching ``patterns`` (``*.svg``, ``**/*.css``, exact names), keyed by
+relative path. Plugin, theme and resource archives are read in one pass in member order.
+Names that do not exist are left out."""
+    ...
+
+class AsyncFile:
+    """File opened with ``overlay_open`` on the I/O pool; every call is awaited there.
+Usable as ``f = await aopen(...)`` and as ``async with aopen(...) as f``."""
+    name: Any = ...
+    mode: str = ...
+    def __init__(self, file, mode = 'r', *args, **kwargs) -> Any:
+        ...
+    def __await__(self) -> Any:
+        ...
+    async def __aenter__(self) -> AsyncFile:
+        ...
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> Any:
+        ...
+    @property
+    def closed(self) -> bool:
+        ...
+    async def read(self, size: int = -1) -> Any:
+        ...
+    async def readline(self, size: int = -1) -> Any:
+        ...
+    async def readlines(self) -> list:
+        ...
+    async def write(self, data) -> int:
+        ...
+    async def seek(self, offset: int, whence: int = 0) -> int:
+        ...
+    async def tell(self) -> int:
+        ...
+    async def flush(self) -> Any:
+        ...
+    async def close(self) -> Any:
+        ...
+
+def aopen(file, mode = 'r', *args, **kwargs) -> AsyncFile:
+    """Async ``open`` for paths and plugin://, pldata://, project:// and other fs urls"""
+    ...
+
+async def aread(file, mode: str = 'r', **kwargs) -> Any:
+    """Reads a whole file in one trip to the I/O pool"""
+    ...
+
+async def awrite(file, data, mode: Optional[str] = None, **kwargs) -> int:
+    """Writes a whole file in one trip to the I/O pool; mode defaults to "w" or "wb" by data type"""
+    ...
+
 class EmitterFakeInput:
     c_keycode: Any = ...
     w_keycode: Any = ...
@@ -390,4 +476,4 @@ class BaseLinuxKey(StrEnum):
 class BaseWindowsKey(IntEnum):
     ...
 
-__all__ = ['OWidget', 'PluginSettingWidget', 'ModeRuns', 'OWindow', 'PluginSettingWindow', 'OQMLWindow', 'Theme', 'ThemeController', 'modulateImage', 'modulateIcon', 'modulatePixmap', 'BaseHotkeyHandler', 'BaseLinuxKey', 'BaseWindowsKey', 'BaseCommonKey', 'EmitterFakeInput', 'CLInterface', 'MetaCliInterface', 'Config', 'default_configs', 'getSystem', 'open_file_manager']
\ No newline at end of file
+__all__ = ['OWidget', 'PluginSettingWidget', 'ModeRuns', 'OWindow', 'PluginSettingWindow', 'OQMLWindow', 'Theme', 'ThemeController', 'modulateImage', 'modulateIcon', 'modulatePixmap', 'BaseHotkeyHandler', 'BaseLinuxKey', 'BaseWindowsKey', 'BaseCommonKey', 'EmitterFakeInput', 'CLInterface', 'MetaCliInterface', 'Config', 'ConfigDiff', 'default_configs', 'getSystem', 'open_file_manager', 'overlay_open', 'read_many', 'aopen', 'aread', 'awrite']
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Startup cost of importing plugins with and without the bytecode cache.
+
+Builds N synthetic .plugin archives in a temporary app folder and measures
+PluginLoader.load() in fresh interpreters:
+  zipimport - cache disabled (OVERLAY_BYTECODE_CACHE=0), every module compiled
+  cold      - empty cache, modules compiled and written to .cache/bytecode
+  warm      - modules unmarshalled from .cache/bytecode
+
+Usage: python scripts/bench_bytecode_cache.py [--plugins 50] [--runs 5]
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+import zipfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {src!r})
+import core.context_global
+from core.loaders.plugin_loader import PluginLoader
+from core.loaders.bytecode_cache import BytecodeCache
+loader = PluginLoader()
+start = time.perf_counter()
+loader.load()
+elapsed = time.perf_counter() - start
+failed = [name for name, error in loader.errors.items() if error is not None]
+assert not failed, failed
+print(elapsed, BytecodeCache().hits, BytecodeCache().misses)
+"""
+
+
+def make_module(index: int, functions: int) -> str:
+    lines = [f'"""Synthetic module {index}."""', "import math", ""]
+    for number in range(functions):
+        lines += [
+            f"def func_{number}(value, scale={number}):",
+            f"    result = [math.sqrt(abs(value * item)) for item in range(scale % 7 + 1)]",
+            f"    if sum(result) > {number}:",
+            f"        return {{'index': {index}, 'value': value, 'items': result}}",
+            f"    return None",
+            "",
+        ]
+    lines += [
+        f"class Model{index}:",
+        "    def __init__(self):",
+        f"        self.items = {{name: getattr(__import__(__name__), name, None) for name in ('func_0',)}}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def make_plugin(folder: Path, name: str, modules: int, functions: int):
+    with zipfile.ZipFile(folder / f"{name}.plugin", "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "plugin.toml",
+            f'[metadata]\nname = "{name}"\nversion = "1.0.0"\n\n[settings.widget]\n',
+        )
+        imports = "\n".join(f"from . import module_{index}" for index in range(modules))
+        archive.writestr(
+            f"{name}/__init__.py",
+            f"{imports}\n\n\ndef createWidget(parent=None):\n    return None\n",
+        )
+        for index in range(modules):
+            archive.writestr(f"{name}/module_{index}.py", make_module(index, functions))
+
+
+def run_probe(app: Path, cache: bool) -> tuple[float, int, int]:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env["OVERLAY_BYTECODE_CACHE"] = "1" if cache else "0"
+    # the cache, like regular .pyc files, is not written under -B
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(src=str(SRC))],
+        cwd=app, env=env, capture_output=True, text=True, check=True,
+    )
+    elapsed, hits, misses = result.stdout.split()[-3:]
+    return float(elapsed), int(hits), int(misses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plugins", type=int, default=50)
+    parser.add_argument("--modules", type=int, default=4, help="submodules per plugin")
+    parser.add_argument("--functions", type=int, default=60, help="functions per submodule")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory(prefix="overlay-bench-") as tmp:
+        app = Path(tmp)
+        (app / "plugins").mkdir()
+        for number in range(args.plugins):
+            make_plugin(app / "plugins", f"Bench{number:03}", args.modules, args.functions)
+        bytecode = app / ".cache" / "bytecode"
+        
+        # warms the archive index so that every mode starts from the same state
+        run_probe(app, cache=False)
+        
+        timings: dict[str, list[float]] = {"zipimport": [], "cold": [], "warm": []}
+        for _ in range(args.runs):
+            timings["zipimport"].append(run_probe(app, cache=False)[0])
+            shutil.rmtree(bytecode, ignore_errors=True)
+            timings["cold"].append(run_probe(app, cache=True)[0])
+            elapsed, hits, misses = run_probe(app, cache=True)
+            assert misses == 0, f"warm run missed the cache {misses} times"
+            timings["warm"].append(elapsed)
+    
+    modules = args.plugins * (args.modules + 1)
+    print(f"{args.plugins} plugins, {modules} modules, {args.runs} runs (median PluginLoader.load)")
+    baseline = statistics.median(timings["zipimport"])
+    for mode, values in timings.items():
+        median = statistics.median(values)
+        print(f"{mode:<10} {median * 1000:9.1f} ms  x{baseline / median:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Parse (and write, where the backend can) time of every codec backend on the configs the app reads:
+  overlay.toml       - src/assets/overlay.toml, read on every start
+  plugin.toml        - a typical plugin config (metadata + settings.window)
+  theme.toml         - a typical theme config (metadata + palette)
+  theme_cache.toml   - the ResourceBuilder colors cache
+  settings.toml      - configs/settings.toml with the options main_window reads
+  configs_plugins    - saved state of --plugins plugins (json, json5)
+  locale/*.yaml      - src/assets/locale translations
+
+The fastest reader of a format can be selected with OVERLAY_CODEC_<FORMAT> or codecs.toml in settings.
+
+Usage: python scripts/bench_codecs.py [--calls 2000] [--plugins 30]
+"""
+import sys
+import time
+import json
+import argparse
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PLUGIN_TOML = """
+[metadata]
+name = "Clock"
+author = "SnayperTihCreator"
+version = "Beta 1.2.0 - stable"
+description = "Clock on the desktop"
+
+[settings]
+style_file = "style.css"
+
+[settings.window]
+width = 300
+height = 120
+opacity = 0.85
+"""
+
+THEME_TOML = """
+[metadata]
+name = "Dark"
+author = "SnayperTihCreator"
+version = "Release 1.0.0 - stable"
+description = "Dark theme"
+
+[palette]
+base = "#1e1f22"
+main_text = "#dfe1e5"
+alt_text = "#8c8f94"
+"""
+
+THEME_CACHE_TOML = """
+main_color = "#dfe1e5"
+alt_color = "#8c8f94"
+"""
+
+SETTINGS_TOML = """
+theme = "Dark"
+language = "ru"
+
+[plugins]
+lazy_import = true
+progressive_activation = true
+activation_budget_ms = 8
+
+[fs]
+watch = true
+resolver_cache_size = 64
+
+[shortkey]
+open = "ctrl+alt+o"
+
+[websockets]
+in = 8000
+"""
+
+
+def plugin_states(plugins: int) -> dict:
+    return {
+        f"Plugin{index}_1.0": {
+            "position": {"x": 100 + index, "y": 200 + index},
+            "clone_count": index % 3,
+            "is_duplicate": False,
+            "fields": {"opacity": 0.85, "text": f"plugin {index}", "enabled": True},
+        }
+        for index in range(plugins)
+    }
+
+
+def timed(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--plugins", type=int, default=30)
+    args = parser.parse_args()
+    
+    sys.path.insert(0, str(SRC))
+    from utils import codecs
+    
+    states = plugin_states(args.plugins)
+    samples = [
+        ("toml", "overlay.toml", (SRC / "assets" / "overlay.toml").read_text(encoding="utf-8")),
+        ("toml", "plugin.toml", PLUGIN_TOML),
+        ("toml", "theme.toml", THEME_TOML),
+        ("toml", "theme_cache.toml", THEME_CACHE_TOML),
+        ("toml", "settings.toml", SETTINGS_TOML),
+        ("json", "configs_plugins", json.dumps(states, indent=4)),
+        ("json5", "configs_plugins", codecs.dumps("json5", states) if "json5" in codecs.formats() else ""),
+    ]
+    for file in sorted((SRC / "assets" / "locale").glob("*.yaml")):
+        samples.append(("yaml", f"locale/{file.name}", file.read_text(encoding="utf-8")))
+    
+    print(f"{args.calls} calls, us per call")
+    print(f"{'format':<6} {'file':<18} {'bytes':>6} {'backend':<9} {'read':>8} {'write':>8}")
+    for fmt, name, text in samples:
+        if fmt not in codecs.formats():
+            print(f"{fmt:<6} {name:<18} {'-':>6} not installed")
+            continue
+        for backend in codecs.available(fmt):
+            codec = codecs.codec(fmt, backend)
+            data = codec.loads(text)
+            read = timed(lambda: codec.loads(text), args.calls)
+            write = f"{timed(lambda: codec.dumps(data), args.calls):8.1f}" if codec.writable else f"{'-':>8}"
+            print(f"{fmt:<6} {name:<18} {len(text.encode()):>6} {backend:<9} {read:8.1f} {write}")
+    
+    print("selected:", ", ".join(f"{fmt}={codecs.codec(fmt).name}" for fmt in codecs.formats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Cost of one open() + read() through the fs url layer, per call:
+  plain    - a regular file path, builtins.open vs overlay_open (the fall-through check)
+  plugin   - plugin:///data/value.txt inside the context of N plugins in turn
+  qt       - qt://bench/value.txt from a registered binary resource
+
+"open_fs" is the cost without a resolver cache (what every call paid once the old
+lru_cache(10) was thrashed by more than ten plugins), "overlay_open" goes through UrlResolver.
+
+Usage: python scripts/bench_open.py [--calls 2000] [--plugins 16]
+"""
+import os
+import sys
+import time
+import shutil
+import zipfile
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def build_app(root: Path, plugins: int):
+    (root / "plugins").mkdir()
+    for index in range(plugins):
+        with zipfile.ZipFile(root / "plugins" / f"Bench{index}.plugin", "w") as archive:
+            archive.writestr("data/value.txt", f"plugin {index}")
+    (root / "value.txt").write_text("plain", encoding="utf-8")
+    (root / "value_qt.txt").write_text("qt", encoding="utf-8")
+    (root / "bench.qrc").write_text(
+        '<RCC><qresource prefix="/bench"><file alias="value.txt">value_qt.txt</file></qresource></RCC>',
+        encoding="utf-8",
+    )
+    tool = shutil.which("pyside6-rcc")
+    if tool is None:
+        sys.exit("pyside6-rcc not found in PATH")
+    subprocess.run([tool, "--binary", str(root / "bench.qrc"), "-o", str(root / "bench.rcc")], check=True)
+
+
+def timed(func, calls: int) -> float:
+    start = time.perf_counter()
+    for index in range(calls):
+        func(index)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--plugins", type=int, default=16)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory(prefix="overlay-open-") as tmp:
+        root = Path(tmp)
+        build_app(root, args.plugins)
+        # getAppPath() is the working directory
+        os.chdir(root)
+        sys.path.insert(0, str(SRC))
+        
+        from PySide6.QtCore import QResource
+        import core.context_global
+        from core.context import contextPlugin
+        from fs import open_fs
+        from utils.fs import overlay_open, UrlResolver
+        
+        QResource.registerResource(str(root / "bench.rcc"))
+        names = [f"Bench{index}" for index in range(args.plugins)]
+        plain = str(root / "value.txt")
+        
+        def read_plain_builtin(index):
+            with open(plain) as file:
+                file.read()
+        
+        def read_plain_overlay(index):
+            with overlay_open(plain) as file:
+                file.read()
+        
+        def read_plugin_open_fs(index):
+            name = names[index % len(names)]
+            with open_fs(f"plugin://{name}/data").open("value.txt") as file:
+                file.read()
+        
+        def read_plugin_overlay(index):
+            with contextPlugin(names[index % len(names)]):
+                with overlay_open("plugin:///data/value.txt") as file:
+                    file.read()
+        
+        def read_qt_open_fs(index):
+            with open_fs("qt://bench").open("value.txt") as file:
+                file.read()
+        
+        def read_qt_overlay(index):
+            with overlay_open("qt://bench/value.txt") as file:
+                file.read()
+        
+        rows = [
+            ("plain", timed(read_plain_builtin, args.calls), timed(read_plain_overlay, args.calls)),
+            ("plugin", timed(read_plugin_open_fs, args.calls), timed(read_plugin_overlay, args.calls)),
+            ("qt", timed(read_qt_open_fs, args.calls), timed(read_qt_overlay, args.calls)),
+        ]
+        stats = UrlResolver().stats()
+        os.chdir(SRC)
+    
+    print(f"{args.calls} calls, {args.plugins} plugins, us per open+read")
+    print(f"{'url':<8} {'baseline':>10} {'overlay_open':>13}")
+    for name, baseline, resolved in rows:
+        print(f"{name:<8} {baseline:10.1f} {resolved:13.1f}")
+    print(f"resolver: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Startup time and memory of the two ways to ship Qt resources:
+  module - assets_rc.py (pyside6-rcc), every file is a bytes literal unmarshalled at import
+  rcc    - assets.rcc (pyside6-rcc --binary) registered with QResource, mapped from disk
+
+Both are built from src/assets.qrc into a temporary folder. Each run is a fresh
+interpreter that measures registerResources() and the RSS growth after it and
+after reading every resource once.
+
+Usage: python scripts/bench_resources.py [--runs 5]
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PROBE = """
+import sys, time, json
+sys.path[:0] = [{tmp!r}, {src!r}]
+import psutil
+from PySide6.QtCore import QDirIterator, QFile, QIODevice
+from utils.fs.resources import registerResources
+
+process = psutil.Process()
+base = process.memory_info().rss
+start = time.perf_counter()
+mode = registerResources()
+elapsed = time.perf_counter() - start
+registered = process.memory_info().rss
+
+size = 0
+iterator = QDirIterator(":/", QDirIterator.IteratorFlag.Subdirectories)
+while iterator.hasNext():
+    path = iterator.next()
+    file = QFile(path)
+    if path.startswith(":/qt-project.org") or not file.open(QIODevice.OpenModeFlag.ReadOnly):
+        continue
+    size += len(file.readAll())
+    file.close()
+read = process.memory_info().rss
+
+print(json.dumps({{"mode": mode, "ms": elapsed * 1000, "registered": registered - base, "read": read - base, "size": size}}))
+"""
+
+
+def rcc(*args):
+    tool = shutil.which("pyside6-rcc")
+    if tool is None:
+        sys.exit("pyside6-rcc not found in PATH")
+    subprocess.run([tool, *args], check=True)
+
+
+def run_probe(tmp: Path, mode: str) -> dict:
+    env = dict(os.environ, OVERLAY_RESOURCES=mode, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(tmp=str(tmp), src=str(SRC))],
+        cwd=tmp, env=env, capture_output=True, text=True, check=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    assert data["mode"] == mode, f"expected {mode}, registered {data['mode']}"
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory(prefix="overlay-rcc-") as tmp:
+        tmp = Path(tmp)
+        qrc = SRC / "assets.qrc"
+        rcc(str(qrc), "-o", str(tmp / "assets_rc.py"))
+        rcc("--binary", str(qrc), "-o", str(tmp / "assets.rcc"))
+        # getAssetsPath() is relative to the working directory
+        (tmp / "assets").mkdir()
+        
+        results = {mode: [run_probe(tmp, mode) for _ in range(args.runs)] for mode in ("module", "rcc")}
+        sizes = {
+            "module": (tmp / "assets_rc.py").stat().st_size,
+            "rcc": (tmp / "assets.rcc").stat().st_size,
+        }
+    
+    mb = 1024 * 1024
+    print(f"{args.runs} runs, medians; RSS growth is relative to the interpreter before registration")
+    print(f"{'mode':<8} {'file MB':>8} {'register ms':>12} {'RSS MB':>8} {'RSS after read MB':>18}")
+    for mode, runs in results.items():
+        print(
+            f"{mode:<8} {sizes[mode] / mb:8.2f} {statistics.median(r['ms'] for r in runs):12.2f} "
+            f"{statistics.median(r['registered'] for r in runs) / mb:8.2f} "
+            f"{statistics.median(r['read'] for r in runs) / mb:18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import sys
 import os
 import pathlib
 import zipfile
+import subprocess
 from typing import TYPE_CHECKING
 
 DISTPATH: str
@@ -13,7 +14,7 @@ sys.path.append(os.path.join(BASE_DIR, 'src'))
 
 if TYPE_CHECKING:
     from PyInstaller.building.build_main import Analysis, PYZ, EXE, COLLECT
-    
+
 from PyInstaller.building.utils import logger
 
 from core.main_init import OpenManager
@@ -36,7 +37,27 @@ def buildZipFile(dist: pathlib.Path, dir_name: str):
         logger.info("📁 Архив собран")
 
 
+def buildResourceBundle(qrc: str, rcc: str) -> bool:
+    """assets.rcc is mapped by Qt at runtime instead of unmarshalling assets_rc into the heap"""
+    if os.environ.get("OVERLAY_RESOURCES", "rcc").lower() == "module":
+        return False
+    try:
+        subprocess.run(["pyside6-rcc", "--binary", qrc, "-o", rcc], check=True)
+        logger.info("📦 Ресурсы собраны в assets.rcc")
+        return True
+    except Exception as e:
+        logger.warning(f"assets.rcc не собран, используется assets_rc: {e}")
+        return False
+
+
 hiddenimports = ["requests", "colorama", "PySide6.QtCharts"]
+datas = []
+excludes = []
+
+ASSETS_RCC = os.path.join(BASE_DIR, 'src', 'assets.rcc')
+if buildResourceBundle(os.path.join(BASE_DIR, 'src', 'assets.qrc'), ASSETS_RCC):
+    datas.append((ASSETS_RCC, '.'))
+    excludes.append("assets_rc")
 
 match getSystem():
     case ["win32", _]:
@@ -49,12 +70,12 @@ with OpenManager():
         [os.path.join(BASE_DIR, 'src', 'overlay.py')],
         pathex=[os.path.join(BASE_DIR, 'src')],
         binaries=[],
-        datas=[],
+        datas=datas,
         hiddenimports=hiddenimports,
         hookspath=[],
         hooksconfig={},
         runtime_hooks=[],
-        excludes=[],
+        excludes=excludes,
         noarchive=False,
         optimize=0,
     )
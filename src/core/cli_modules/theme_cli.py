@@ -15,10 +15,23 @@ class ThemeCLI(CLInterface, docs_interface="Протокол для управл
         logger.info("ThemeCLI initialized successfully.")
     
     @lru_cache(128)
-    def _get_theme_name(self, name):
+    def _get_theme_type(self, name):
         logger.debug(f"Loading theme class: {name}")
-        themeType = self.loader.loadTheme(name)
-        return themeType()
+        return self.loader.loadTheme(name)
+    
+    @lru_cache(128)
+    def _get_theme_name(self, name):
+        return self._get_theme_type(name)()
+    
+    def resolve(self, name: str):
+        """Imports the theme archive without instantiating the theme (safe off the UI thread)."""
+        if name is None or name == "DefaultTheme":
+            return None
+        try:
+            return self._get_theme_type(name)
+        except Exception as e:
+            logger.warning(f"Failed to resolve theme '{name}': {e}")
+            return None
     
     @CLInterface.register()
     def change(self, name: str):
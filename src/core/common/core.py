@@ -9,7 +9,7 @@ from PySide6.QtWidgets import QWidget
 from ldt import LDT
 
 if TYPE_CHECKING:
-    from core.config import Config
+    from core.config import Config, ConfigDiff
     from plugins.preloaders import PreLoader
     from gui.main_window import Overlay
 
@@ -42,6 +42,11 @@ class APIBaseWidget(QWidget, ABC, metaclass=MetaBaseWidget):
     def load_config(self):
         ...
     
+    def apply_config(self, diff: ConfigDiff):
+        """Applies the changes of a reload; everything is loaded again by default"""
+        if diff:
+            self.load_config()
+    
     def ready(self):
         try:
             self.__ready__()
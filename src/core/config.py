@@ -1,11 +1,13 @@
 from __future__ import annotations
+import hashlib
 import logging
-import io
-from typing import Literal, Type, TypeVar, Generic
+import threading
+from typing import Any, Callable, Iterator, Literal, Optional, Type, TypeVar, Generic
 
 from attrs import define, field
-import toml
 
+from utils import codecs
+from utils.fs import overlay_buffer
 from .default_configs import *
 
 # Setup logger
@@ -14,6 +16,143 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseConfig)
 
 
+class MetaSingConfigCache(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class ConfigCache(metaclass=MetaSingConfigCache):
+    """
+    Parsed and validated configs shared by all Config instances, keyed by (url, scheme).
+    A url is read again only after ``invalidate`` (file watcher) or a forced reload, and parsed
+    again only if the content hash changed, so duplicates of a plugin share one frozen model.
+    """
+    
+    def __init__(self):
+        # (url, scheme) -> (content hash, model)
+        self._models: dict[tuple[str, type], tuple[bytes, BaseConfig]] = {}
+        self._stale: set[tuple[str, type]] = set()
+        self._empty: dict[type, BaseConfig] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.reads = 0
+        self.parses = 0
+    
+    @staticmethod
+    def _digest(data) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def get(self, url: str, scheme: Type[T], fresh: bool = False) -> T:
+        """Model of ``url``; ``fresh`` re-reads the file but reuses the model if it did not change"""
+        key = (url, scheme)
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is not None and not fresh and key not in self._stale:
+                self.hits += 1
+                return cached[1]
+        
+        data = overlay_buffer(url)
+        digest = self._digest(data)
+        with self._lock:
+            self.reads += 1
+            self._stale.discard(key)
+            cached = self._models.get(key)
+            if cached is not None and cached[0] == digest:
+                return cached[1]
+        
+        model = scheme(**codecs.loads("toml", data))
+        with self._lock:
+            self.parses += 1
+            self._models[key] = (digest, model)
+        return model
+    
+    def empty(self, scheme: Type[T]) -> T:
+        """Shared model for configs without a file"""
+        with self._lock:
+            model = self._empty.get(scheme)
+            if model is None:
+                model = self._empty[scheme] = scheme()
+            else:
+                self.hits += 1
+            return model
+    
+    def invalidate(self, prefix: Optional[str] = None):
+        """Marks all urls, or the ones starting with ``prefix`` (``plugin://MyPlugin/``), to be read again"""
+        with self._lock:
+            self._stale.update(key for key in self._models if prefix is None or key[0].startswith(prefix))
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "reads": self.reads,
+                "parses": self.parses,
+                "size": len(self._models),
+                "stale": len(self._stale),
+            }
+
+
+_MISSING = object()
+
+
+def _flatten(data: Any, prefix: str = "") -> dict[str, Any]:
+    """Nested dicts as {"settings.window.width": 300, ...}"""
+    if not isinstance(data, dict) or not data:
+        return {prefix: data}
+    result = {}
+    for key, value in data.items():
+        result.update(_flatten(value, f"{prefix}.{key}" if prefix else key))
+    return result
+
+
+def _overlaps(path: str, other: str) -> bool:
+    return path == other or path.startswith(f"{other}.") or other.startswith(f"{path}.")
+
+
+@define(frozen=True)
+class ConfigDiff:
+    """
+    Fields changed by a reload as dotted paths (``settings.window.width``) -> (old, new).
+    A field that appeared or disappeared has ``None`` on the missing side.
+    """
+    
+    changes: dict[str, tuple[Any, Any]] = field(factory=dict)
+    
+    @classmethod
+    def between(cls, old: Optional[BaseConfig], new: BaseConfig) -> ConfigDiff:
+        if old is new:
+            return cls()
+        before = _flatten(old.model_dump()) if old is not None else {}
+        after = _flatten(new.model_dump())
+        changes = {}
+        for path in before.keys() | after.keys():
+            value_old, value_new = before.get(path, _MISSING), after.get(path, _MISSING)
+            if value_old != value_new:
+                changes[path] = (None if value_old is _MISSING else value_old,
+                                 None if value_new is _MISSING else value_new)
+        return cls(changes)
+    
+    def __bool__(self):
+        return bool(self.changes)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self.changes))
+    
+    def changed(self, *paths: str) -> bool:
+        """Whether any of ``paths``, a field inside them or a section containing them changed"""
+        return any(_overlaps(path, key) for path in paths for key in self.changes)
+
+
+@define
+class _Listener:
+    path: str = field()
+    callback: Callable[[ConfigDiff], None] = field()
+
+
 @define
 class Config(Generic[T]):
     """
@@ -27,11 +166,13 @@ class Config(Generic[T]):
     
     _scheme: Type[T] = field(default=None, repr=False)
     _config: T = field(init=False, repr=False)
+    _overrides: dict[str, Any] = field(init=False, factory=dict, repr=False)
+    _listeners: list[_Listener] = field(init=False, factory=list, repr=False)
     
     def __attrs_post_init__(self):
         if self._scheme is None:
             self._scheme = self.getSchemeConfig(self._resource_type)
-        self.reload()
+        self._config = self._load_config()
     
     @staticmethod
     def getSchemeConfig(resource_type: str) -> Type[T]:
@@ -49,26 +190,30 @@ class Config(Generic[T]):
                 logger.error(msg)
                 raise TypeError(msg)
     
-    def _load_config(self) -> T:
-        """Loads configuration using (modified) open function."""
-        configFile = None
-        
+    @property
+    def url(self) -> Optional[str]:
+        """Url of the config file, None for configs without one"""
+        match self._resource_type:
+            case "apps":
+                return "qt://app/overlay.toml"
+            case "window" | "widget":
+                return f"plugin://{self.name}/plugin.toml"
+            case "theme":
+                return f"resource://theme/{self.name}/{self._config_name}.toml"
+        return None
+    
+    def _load_config(self, fresh: bool = False) -> T:
+        """Loads configuration through the shared ConfigCache."""
         logger.debug(f"Loading config: {self._resource_name} (type: {self._resource_type})")
         
         try:
-            match self._resource_type:
-                case "apps":
-                    configFile = open("qt://app/overlay.toml", encoding="utf-8")
-                case "window" | "widget":
-                    configFile = open(f"plugin://{self.name}/plugin.toml", encoding="utf-8")
-                case "setting":
-                    configFile = io.StringIO()
-                case "theme":
-                    configFile = open(f"resource://theme/{self.name}/{self._config_name}.toml", encoding="utf-8")
+            url = self.url
+            if url is None:
+                return ConfigCache().empty(self._scheme)
             
-            data = toml.load(configFile)
-            logger.info(f"Config loaded successfully: {self._resource_name}")
-            return self._scheme(**data)
+            config = ConfigCache().get(url, self._scheme, fresh)
+            logger.debug(f"Config loaded successfully: {self._resource_name}")
+            return config
         
         except FileNotFoundError as e:
             if self._resource_type == "apps":
@@ -79,7 +224,7 @@ class Config(Generic[T]):
                         # Serialize default scheme
                         default_instance = self._scheme()
                         default_data = default_instance.model_dump() if hasattr(default_instance, 'model_dump') else {}
-                        toml.dump(default_data, file)
+                        file.write(codecs.dumps("toml", default_data))
                     
                     return self._scheme()
                 except Exception as write_err:
@@ -92,10 +237,6 @@ class Config(Generic[T]):
         except Exception as e:
             logger.error(f"Failed to load config '{self._resource_name}': {e}", exc_info=True)
             return self._scheme()
-        
-        finally:
-            if configFile is not None:
-                configFile.close()
     
     @property
     def data(self) -> T:
@@ -110,10 +251,37 @@ class Config(Generic[T]):
     def type(self) -> str:
         return self._resource_type
     
-    def reload(self):
-        """Reloads data from file."""
+    def override(self, **changes):
+        """Replaces top-level fields for this instance only; the shared model stays untouched."""
+        self._overrides.update(changes)
+        self._config = self._config.model_copy(update=changes)
+    
+    def subscribe(self, path: str, callback: Callable[[ConfigDiff], None]):
+        """``callback`` gets the diff of a reload that changed ``path`` (e.g. ``settings.window``)"""
+        self._listeners.append(_Listener(path, callback))
+    
+    def unsubscribe(self, callback: Callable[[ConfigDiff], None]):
+        self._listeners = [listener for listener in self._listeners if listener.callback != callback]
+    
+    def reload(self) -> ConfigDiff:
+        """Reloads data from file, keeping the overrides of this instance. Returns the changed fields."""
         logger.debug(f"Reloading config for {self.name}...")
-        self._config = self._load_config()
+        config = self._load_config(fresh=True)
+        if self._overrides:
+            config = config.model_copy(update=self._overrides)
+        diff = ConfigDiff.between(self._config, config)
+        self._config = config
+        
+        if diff:
+            logger.info(f"Config '{self.name}' changed: {', '.join(diff)}")
+        for listener in list(self._listeners):
+            if not diff.changed(listener.path):
+                continue
+            try:
+                listener.callback(diff)
+            except Exception as e:
+                logger.error(f"Config change callback failed for '{listener.path}': {e}", exc_info=True)
+        return diff
     
     @classmethod
     def configApplication(cls) -> Config[AppConfig]:
@@ -1,10 +1,12 @@
-import toml
+from utils import codecs
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BaseConfig(BaseModel):
+    # validated configs are shared between Config instances (see ConfigCache)
+    model_config = ConfigDict(frozen=True)
     
     @classmethod
     def from_toml(cls, toml_data: str):
-        return cls(**toml.loads(toml_data))
+        return cls(**codecs.loads("toml", toml_data))
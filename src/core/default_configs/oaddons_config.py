@@ -3,7 +3,7 @@ from pydantic.dataclasses import dataclass
 from .common_config import CommonConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class Platform:
     platform: str
     window: str
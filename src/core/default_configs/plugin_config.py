@@ -6,19 +6,19 @@ from pydantic import Field
 from .common_config import CommonConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class WindowSettings:
     width: int
     height: int
     opacity: float = Field(ge=0.0, le=1.0)
 
 
-@dataclass
+@dataclass(frozen=True)
 class WidgetSettings:
     ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
     style_file: str
     window: Optional[WindowSettings] = Field(None)
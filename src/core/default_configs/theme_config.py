@@ -8,7 +8,7 @@ from .common_config import CommonConfig
 pattern_color = re.compile(r'^#[A-Fa-f0-9]{6}|#[A-Fa-f0-9]{3}$')
 
 
-@dataclass
+@dataclass(frozen=True)
 class Palette:
     base: str = Field(..., pattern=pattern_color)
     main_text: str = Field(..., pattern=pattern_color)
@@ -0,0 +1,198 @@
+import os
+import json
+import hashlib
+import zipfile
+import threading
+import logging
+from pathlib import Path
+from typing import Optional
+
+from attrs import define, field, asdict
+
+from core.default_configs import MetaData
+from utils import codecs
+from utils.fs import getAppPath
+from utils.fs.fs_base import ListingCache
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# [settings.<key>] table in plugin.toml -> plugin type
+DECLARED_TYPES = {"window": "Window", "widget": "Widget"}
+
+
+class MetaSingIndex(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+@define
+class ArchiveKind:
+    folder: str = field()
+    suffix: str = field()
+    config: str = field()
+
+
+@define
+class ArchiveEntry:
+    name: str = field()
+    path: str = field()
+    size: int = field()
+    mtime: int = field()
+    hash: str = field()
+    metadata: Optional[dict] = field(default=None)
+    types: list[str] = field(factory=list)
+    members: list[str] = field(factory=list, repr=False)
+    
+    def isStale(self, stat: os.stat_result) -> bool:
+        return self.size != stat.st_size or self.mtime != stat.st_mtime_ns
+
+
+class ArchiveIndex(metaclass=MetaSingIndex):
+    """
+    On-disk index of installed .plugin/.overtheme/.oaddons archives (.cache/archives.json).
+    An archive is re-read only when its size or mtime changed.
+    """
+    
+    kinds = {
+        "plugin": ArchiveKind("plugins", ".plugin", "plugin.toml"),
+        "overtheme": ArchiveKind("resource", ".overtheme", "theme.toml"),
+        "oaddons": ArchiveKind("resource", ".oaddons", "oaddons.toml"),
+    }
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or (getAppPath() / ".cache" / "archives.json")
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict[str, ArchiveEntry]] = {kind: {} for kind in self.kinds}
+        self._load()
+    
+    def _load(self):
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            if raw.get("version") != INDEX_VERSION:
+                logger.info("Archive index version changed, rebuilding")
+                return
+            for kind, entries in raw.get("archives", {}).items():
+                if kind in self._entries:
+                    self._entries[kind] = {name: ArchiveEntry(**data) for name, data in entries.items()}
+            logger.debug(f"Archive index loaded: {self.path}")
+        except FileNotFoundError:
+            logger.debug("Archive index not found, it will be created")
+        except Exception as e:
+            logger.warning(f"Archive index is corrupt, rebuilding: {e}")
+    
+    def _save(self):
+        data = {
+            "version": INDEX_VERSION,
+            "archives": {
+                kind: {name: asdict(entry) for name, entry in entries.items()}
+                for kind, entries in self._entries.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save archive index: {e}", exc_info=True)
+    
+    def _build_entry(self, kind: ArchiveKind, file: Path, stat: os.stat_result) -> ArchiveEntry:
+        digest = hashlib.md5()
+        with file.open("rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 20), b""):
+                digest.update(chunk)
+        
+        entry = ArchiveEntry(file.stem, str(file), stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        try:
+            with zipfile.ZipFile(file) as archive:
+                entry.members = archive.namelist()
+                if kind.config in entry.members:
+                    config = codecs.loads("toml", archive.read(kind.config))
+                    entry.metadata = config.get("metadata")
+                    settings = config.get("settings", {})
+                    entry.types = [name for key, name in DECLARED_TYPES.items() if key in settings]
+        except Exception as e:
+            logger.warning(f"Failed to index archive '{file.name}': {e}")
+        return entry
+    
+    def _check(self, kind_name: str, file: Path) -> tuple[Optional[ArchiveEntry], bool]:
+        """Returns the up-to-date entry for one archive and whether it was rebuilt."""
+        try:
+            stat = file.stat()
+        except OSError:
+            return None, False
+        entry = self._entries[kind_name].get(file.stem)
+        if entry is not None and not entry.isStale(stat):
+            return entry, False
+        return self._build_entry(self.kinds[kind_name], file, stat), True
+    
+    def refresh(self, kind_name: str) -> dict[str, ArchiveEntry]:
+        """Syncs one archive kind with its folder and returns its entries."""
+        kind = self.kinds[kind_name]
+        folder = getAppPath() / kind.folder
+        
+        with self._lock:
+            entries = self._entries[kind_name]
+            found: dict[str, ArchiveEntry] = {}
+            changed = 0
+            
+            try:
+                files = [folder / name for name in ListingCache().listdir(str(folder), kind.suffix)]
+            except FileNotFoundError:
+                files = []
+            
+            for file in files:
+                entry, rebuilt = self._check(kind_name, file)
+                if entry is not None:
+                    found[file.stem] = entry
+                    changed += rebuilt
+            
+            if changed or found.keys() != entries.keys():
+                logger.info(f"Archive index '{kind_name}': {changed} changed, {len(found)} total")
+                self._entries[kind_name] = found
+                self._save()
+            return dict(found)
+    
+    def digests(self) -> set[str]:
+        """Hashes of every indexed archive, all kinds."""
+        with self._lock:
+            return {entry.hash for entries in self._entries.values() for entry in entries.values()}
+    
+    def names(self, kind_name: str) -> list[str]:
+        return sorted(self.refresh(kind_name))
+    
+    def get(self, kind_name: str, name: str) -> Optional[ArchiveEntry]:
+        """Looks up a single archive, checking only that file."""
+        kind = self.kinds[kind_name]
+        file = getAppPath() / kind.folder / f"{name}{kind.suffix}"
+        
+        with self._lock:
+            entry, rebuilt = self._check(kind_name, file)
+            if entry is None:
+                if self._entries[kind_name].pop(name, None) is not None:
+                    self._save()
+            elif rebuilt:
+                self._entries[kind_name][name] = entry
+                self._save()
+            return entry
+    
+    def stamp(self, kind_name: str, name: str) -> Optional[tuple[int, int]]:
+        """(mtime, size) of an archive file, None if it is missing."""
+        kind = self.kinds[kind_name]
+        try:
+            stat = (getAppPath() / kind.folder / f"{name}{kind.suffix}").stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def metadata(self, kind_name: str, name: str) -> Optional[MetaData]:
+        entry = self.get(kind_name, name)
+        if entry is None or entry.metadata is None:
+            return None
+        return MetaData(**entry.metadata)
@@ -0,0 +1,176 @@
+import os
+import sys
+import marshal
+import shutil
+import logging
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+from zipimport import zipimporter
+from importlib.util import MAGIC_NUMBER, spec_from_file_location
+
+from utils.fs import getAppPath
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "OVERLAY_BYTECODE_CACHE"
+
+
+class MetaSingBytecode(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class BytecodeCache(metaclass=MetaSingBytecode):
+    """
+    Compiled code of modules imported from archives (.cache/bytecode).
+    zipimport never writes .pyc, so without it every launch recompiles plugins, themes and addons.
+    Entries are keyed by the archive hash from ArchiveIndex, the interpreter magic number
+    and the optimization level; a changed archive simply gets a new key.
+    """
+    
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or (getAppPath() / ".cache" / "bytecode")
+        self.tag = f"{MAGIC_NUMBER.hex()}-opt{sys.flags.optimize}"
+        self.enabled = os.environ.get(CACHE_ENV, "1").lower() not in ("0", "false", "no")
+        self.hits = 0
+        self.misses = 0
+        
+        if not self.enabled:
+            logger.info("Bytecode cache disabled")
+    
+    def _file(self, digest: str, stem: str) -> Path:
+        return self.root / f"{digest}-{self.tag}" / f"{stem.replace(os.sep, '.')}.pyc"
+    
+    def load(self, digest: str, stem: str):
+        try:
+            data = self._file(digest, stem).read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        
+        if data[:len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+            self.misses += 1
+            return None
+        try:
+            code = marshal.loads(memoryview(data)[len(MAGIC_NUMBER):])
+        except Exception as e:
+            logger.warning(f"Corrupt bytecode cache entry '{stem}': {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return code
+    
+    def store(self, digest: str, stem: str, code):
+        if sys.dont_write_bytecode:
+            return
+        file = self._file(digest, stem)
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(tmp, file)
+        except Exception as e:
+            logger.warning(f"Failed to write bytecode cache entry '{stem}': {e}")
+    
+    def prune(self, digests: set[str]):
+        """Removes entries of archives that are gone and of other interpreters."""
+        try:
+            folders = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return
+        for folder in folders:
+            digest, _, tag = folder.name.partition("-")
+            if tag == self.tag and digest in digests:
+                continue
+            shutil.rmtree(folder.path, ignore_errors=True)
+            logger.debug(f"Bytecode cache pruned: {folder.name}")
+    
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class CachedZipImporter(zipimporter):
+    """zipimporter that takes compiled source modules from BytecodeCache."""
+    
+    def __init__(self, path, digest: str):
+        super().__init__(path)
+        self.digest = digest
+        self.cache = BytecodeCache()
+    
+    def _source_stem(self, fullname) -> Optional[str]:
+        """Path of the module inside the archive without '.py', if it is imported from source."""
+        path = self.prefix + fullname.rpartition(".")[2]
+        stem = os.path.join(path, "__init__") if self.is_package(fullname) else path
+        # zipimport prefers bytecode shipped in the archive
+        if f"{stem}.pyc" in self._files or f"{stem}.py" not in self._files:
+            return None
+        return stem
+    
+    def get_filename(self, fullname):
+        stem = self._source_stem(fullname)
+        if stem is None:
+            return super().get_filename(fullname)
+        return self._files[f"{stem}.py"][0]
+    
+    def get_code(self, fullname):
+        stem = self._source_stem(fullname)
+        if stem is None:
+            return super().get_code(fullname)
+        
+        code = self.cache.load(self.digest, stem)
+        if code is None:
+            filename = self._files[f"{stem}.py"][0]
+            source = self.get_data(filename).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            code = compile(source, filename, "exec", dont_inherit=True)
+            self.cache.store(self.digest, stem, code)
+        return code
+    
+    def load_module(self, fullname):
+        """Same contract as zipimporter.load_module, but the code comes from get_code."""
+        code = self.get_code(fullname)
+        package = self.is_package(fullname)
+        filename = self.get_filename(fullname)
+        
+        module = sys.modules.get(fullname)
+        if not isinstance(module, ModuleType):
+            module = ModuleType(fullname)
+            sys.modules[fullname] = module
+        
+        try:
+            locations = None
+            if package:
+                location = os.path.join(self.archive, self.prefix + fullname.rpartition(".")[2])
+                locations = [location]
+                # submodules of the package are imported through the cache as well
+                sys.path_importer_cache[location] = CachedZipImporter(location, self.digest)
+            
+            module.__spec__ = spec_from_file_location(
+                fullname, filename, loader=self, submodule_search_locations=locations
+            )
+            module.__loader__ = self
+            module.__file__ = filename
+            module.__package__ = fullname if package else fullname.rpartition(".")[0]
+            if locations is not None:
+                module.__path__ = locations
+            exec(code, module.__dict__)
+        except BaseException:
+            sys.modules.pop(fullname, None)
+            raise
+        
+        try:
+            return sys.modules[fullname]
+        except KeyError:
+            raise ImportError(f"Loaded module {fullname!r} not found in sys.modules")
+
+
+def archiveImporter(path, digest: Optional[str] = None) -> zipimporter:
+    """Importer for an archive; cached when its hash is known and the cache is enabled."""
+    if digest and BytecodeCache().enabled:
+        return CachedZipImporter(str(path), digest)
+    return zipimporter(str(path))
+
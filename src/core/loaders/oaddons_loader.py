@@ -7,6 +7,9 @@ import logging
 from fs import open_fs
 from core.errors import OAddonsNotFound, OAddonsInit
 
+from .archive_index import ArchiveIndex
+from .bytecode_cache import archiveImporter
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +21,7 @@ class OverlayAddonsLoader:
     def _find_addon_file(self, addon_name: str) -> str:
         """Searches for .oaddons file in resource folder."""
         try:
-            for file in self.fs.listdir(""):
+            for file in ArchiveIndex().names("oaddons"):
                 clean = re.sub(r'(\.oaddons|\[.*?\])', '', file).strip()
                 if clean == addon_name:
                     return file
@@ -44,11 +47,13 @@ class OverlayAddonsLoader:
                 zip_path = zip_path.lstrip('/')
             
             inner_path = os.path.join(zip_path, addon_name).replace("\\", "/")
+            entry = ArchiveIndex().get("oaddons", filename)
+            digest = entry and entry.hash
             
             try:
-                importer = zipimport.zipimporter(inner_path)
+                importer = archiveImporter(inner_path, digest)
             except zipimport.ZipImportError:
-                importer = zipimport.zipimporter(zip_path + ".oaddons")
+                importer = archiveImporter(zip_path + ".oaddons", digest)
             
             module = importer.load_module(os.path.basename(zip_path))
             
@@ -1,33 +1,66 @@
+import sys
+from importlib.machinery import ModuleSpec
 from pathlib import Path
-from zipimport import zipimporter
 import logging
 
 from fs import open_fs
 
 from utils.fs import getAppPath
+from core.service.tracer import traced, span
+from core.service.import_profiler import measure
 
 from .base import Loader
+from .archive_index import ArchiveIndex, ArchiveEntry
+from .bytecode_cache import BytecodeCache, archiveImporter
 
 logger = logging.getLogger(__name__)
 
 
+class LazyPluginModule:
+    """
+    Stand-in for a plugin whose types are declared in plugin.toml.
+    The archive is imported on first access to anything except ``__name__``, ``__spec__`` and ``__loader__``
+    (the import system reads those from sys.modules entries without using the module).
+    """
+    
+    def __init__(self, loader: "PluginLoader", name: str):
+        self.__name__ = name
+        self.__spec__ = ModuleSpec(name, None)
+        self.__loader__ = None
+        self._loader = loader
+        self._module = None
+    
+    def __getattr__(self, item):
+        if self._module is None:
+            self._module = self._loader.importPlugin(self.__name__)
+        return getattr(self._module, item)
+    
+    def __repr__(self):
+        return f"<lazy plugin '{self.__name__}'>"
+
+
 class PluginLoader(Loader):
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
         super().__init__()
         self.folder: Path = (getAppPath() / "plugins")
         self.fs = open_fs("plugin://")
+        self.lazy = lazy
         
         self.plugins = {}
         self.types_plugins = {}
         self.errors = {}
         logger.info(f"PluginLoader initialized. Folder: {self.folder}")
     
+    @traced("PluginLoader.load")
     def load(self):
-        for plugin in self.folder.glob("*.plugin"):
-            plugin_name = plugin.stem
-            importer = zipimporter(str(plugin))
+        for entry in ArchiveIndex().refresh("plugin").values():
+            plugin_name = entry.name
+            if self.lazy and self._loadLazy(entry):
+                continue
             try:
-                module = importer.load_module(plugin_name)
+                importer = archiveImporter(entry.path, entry.hash)
+                with span(f"import:{plugin_name}", category="plugin"), measure(plugin_name):
+                    module = importer.load_module(plugin_name)
                 types = self.searchType(module)
                 self.plugins[plugin_name] = module
                 self.types_plugins[plugin_name] = types
@@ -41,6 +74,57 @@ class PluginLoader(Loader):
                 logger.error(f"Critical error loading plugin '{plugin_name}'", exc_info=True)
         logger.info(f"Plugin loading finished. Total loaded: {len(self.plugins)}")
     
+    def _loadLazy(self, entry: ArchiveEntry) -> bool:
+        """Registers the plugin from its indexed manifest. Returns False if the manifest declares no types."""
+        plugin_name = entry.name
+        types = list(entry.types)
+        
+        if not types:
+            logger.debug(f"Plugin '{plugin_name}' declares no types, importing instead")
+            return False
+        
+        module = LazyPluginModule(self, plugin_name)
+        # PreLoader.loaded takes the sys.modules entry first, so looking a plugin up does not import it;
+        # an import_module of the name also returns the placeholder instead of importing the archive
+        sys.modules.setdefault(plugin_name, module)
+        self.plugins[plugin_name] = module
+        self.types_plugins[plugin_name] = types
+        self.errors[plugin_name] = None
+        logger.info(f"Plugin '{plugin_name}' registered (deferred import). Types: {types}")
+        return True
+    
+    @staticmethod
+    def pruneBytecode():
+        """
+        Drops cached bytecode of archives that are gone. Runs once loading is done, with every
+        archive kind indexed, so entries of themes and addons or ones being written are kept.
+        """
+        index = ArchiveIndex()
+        for kind in index.kinds:
+            index.refresh(kind)
+        BytecodeCache().prune(index.digests())
+    
+    def importPlugin(self, plugin_name):
+        """Imports the plugin archive. Used by deferred plugins on first use."""
+        module = sys.modules.get(plugin_name)
+        if module is not None and not isinstance(module, LazyPluginModule):
+            return module
+        
+        try:
+            with span(f"import:{plugin_name}", category="plugin"), measure(plugin_name):
+                entry = ArchiveIndex().get("plugin", plugin_name)
+                path = entry.path if entry else self.folder / f"{plugin_name}.plugin"
+                importer = archiveImporter(path, entry and entry.hash)
+                module = importer.load_module(plugin_name)
+            self.errors[plugin_name] = None
+            logger.info(f"Plugin '{plugin_name}' imported on demand")
+            return module
+        except Exception as e:
+            self.errors[plugin_name] = e
+            logger.warning(f"Failed to import plugin '{plugin_name}': {e}")
+            logger.error(f"Critical error importing plugin '{plugin_name}'", exc_info=True)
+            raise
+    
     def getTypes(self, plugin_name):
         return self.types_plugins[plugin_name]
     
@@ -1,14 +1,16 @@
-from zipimport import zipimporter
 from typing import Iterator
 import logging
 
 from fs import open_fs
 from attrs import define
 
-from core.metadata import metadata, MetaData
+from core.metadata import MetaData
+from core.service.import_profiler import measure
 from utils.fs import getAppPath
 
 from .base import Loader
+from .archive_index import ArchiveIndex
+from .bytecode_cache import archiveImporter
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +45,10 @@ class ThemeLoader(Loader):
         logger.info(f"Loading theme archive: {name}")
         try:
             themePath = self.folder / f"{name}.overtheme"
-            importer = zipimporter(str(themePath))
-            moduleTheme = importer.load_module("theme")
+            entry = ArchiveIndex().get("overtheme", name)
+            importer = archiveImporter(themePath, entry and entry.hash)
+            with measure("theme"):
+                moduleTheme = importer.load_module("theme")
             logger.info(f"Theme loaded successfully: {name}")
             return getattr(moduleTheme, name)
         except Exception as e:
@@ -53,9 +57,10 @@ class ThemeLoader(Loader):
             raise
     
     def list(self) -> Iterator[ThemeInfo]:
-        for name in self.fs.listdir(""):
+        for name, entry in ArchiveIndex().refresh("overtheme").items():
             try:
-                yield ThemeInfo(name, metadata(f"theme::{name}"))
-            except AttributeError:
+                info = ThemeInfo(name, MetaData(**entry.metadata))
+            except Exception as e:
                 logger.warning(f"Metadata missing/corrupt for theme '{name}': {e}")
-                yield ThemeInfo(name, None)
+                info = ThemeInfo(name, None)
+            yield info
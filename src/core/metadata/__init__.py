@@ -1,6 +1,9 @@
-from typing import Any
+from typing import Any, Hashable, Iterable, Optional
+import threading
 import logging
 
+from attrs import define, field
+
 from core.default_configs import MetaData
 from .model import MetaDataFinder
 
@@ -9,6 +12,20 @@ _meta_finders: list[MetaDataFinder] = []
 logger = logging.getLogger(__name__)
 
 
+@define
+class _Cached:
+    finder: MetaDataFinder = field()
+    context: MetaDataFinder.Context = field()
+    stamp: Optional[Hashable] = field()
+    metadata: MetaData = field()
+
+
+# path -> metadata with the source stamp it was found for
+_cache: dict[str, _Cached] = {}
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
 def registry(cls=None, **kwargs):
     def wrapper(finder):
         if not issubclass(finder, MetaDataFinder):
@@ -32,25 +49,89 @@ def registry(cls=None, **kwargs):
     return wrapper(cls)
 
 
-def metadata(path: str) -> MetaData:
-    logger.debug(f"Searching metadata for: {path}")
-    
+def _find(path: str) -> Optional[_Cached]:
     for finder in _meta_finders:
         try:
             context = finder.Context(path, finder.getTable())
+            stamp = finder.stamp(context)
             md = finder.find_metadata(context)
             if md is not None:
-                return md
+                return _Cached(finder, context, stamp, md)
         
         except Exception as e:
             logger.warning(f"Finder '{type(finder).__name__}' failed for '{path}': {e}")
             logger.debug("Finder traceback:", exc_info=True)
+    return None
+
+
+def _lookup(path: str) -> Optional[MetaData]:
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None:
+        # finders may do I/O here, so the lock is not held
+        try:
+            fresh = cached.finder.stamp(cached.context) == cached.stamp
+        except Exception:
+            fresh = False
+        with _cache_lock:
+            # an invalidate() meanwhile wins over the stamp
+            if fresh and _cache.get(path) is cached:
+                _stats["hits"] += 1
+                return cached.metadata
+    
+    logger.debug(f"Searching metadata for: {path}")
+    found = _find(path)
+    with _cache_lock:
+        _stats["misses"] += 1
+        if found is None:
+            _cache.pop(path, None)
+            return None
+        _cache[path] = found
+    return found.metadata
+
+
+def metadata(path: str) -> MetaData:
+    md = _lookup(path)
+    if md is not None:
+        return md
     
     error_msg = f"Metadata not found for: {path}"
     logger.error(error_msg)
     raise ValueError(error_msg)
 
 
+def metadata_many(paths: Iterable[str]) -> dict[str, MetaData]:
+    """Metadata of several paths at once; paths without metadata are left out"""
+    result = {}
+    for path in paths:
+        md = _lookup(path)
+        if md is not None:
+            result[path] = md
+        else:
+            logger.debug(f"Metadata not found for: {path}")
+    return result
+
+
+def invalidate(path: Optional[str] = None):
+    """Forgets cached metadata of one path or all of them"""
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(path, None)
+
+
+def metadata_stats() -> dict:
+    with _cache_lock:
+        hits, misses, size = _stats["hits"], _stats["misses"], len(_cache)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "size": size,
+    }
+
+
 def version(path: str) -> Any:
     meta = metadata(path)
     return meta.version
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import cached_property
+from typing import Hashable, Optional
 import logging
 
 from attrs import define, field
@@ -53,6 +54,13 @@ class MetaDataFinder(ABC):
     def find_metadata(self, context: "MetaDataFinder.Context") -> MetaData:
         ...
     
+    def stamp(self, context: "MetaDataFinder.Context") -> Optional[Hashable]:
+        """
+        Version of the source of ``context`` (e.g. mtime and size of an archive).
+        Found metadata is reused while it stays the same; None means the source never changes.
+        """
+        return None
+    
     @classmethod
     def getTable(cls):
         return cls._conversion_table_.copy()
@@ -0,0 +1,126 @@
+import time
+import asyncio
+import inspect
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Any
+
+from attrs import define, field
+
+from core.service.tracer import span
+
+logger = logging.getLogger(__name__)
+
+
+class FramePacer:
+    """Calls ``callback`` (usually ``processEvents``) at most once per frame interval."""
+    
+    def __init__(self, callback: Callable[[], Any], fps: int = 60):
+        self.callback = callback
+        self.interval = 1 / fps
+        self._last = 0.0
+    
+    def due(self) -> bool:
+        return (time.perf_counter() - self._last) >= self.interval
+    
+    def tick(self, force: bool = False) -> bool:
+        if not (force or self.due()):
+            return False
+        self._last = time.perf_counter()
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"Frame callback failed: {e}", exc_info=True)
+        return True
+
+
+@define
+class BootTask:
+    name: str = field()
+    func: Callable = field(repr=False)
+    depends: tuple[str, ...] = field(factory=tuple, converter=tuple)
+    thread: bool = field(default=True)
+
+
+class BootScheduler:
+    """
+    Runs boot tasks as a dependency graph.
+    Independent ``thread`` tasks run concurrently on worker threads, the rest on the
+    UI thread; between completions only the frame pacer touches the Qt event queue.
+    """
+    
+    def __init__(self, pacer: Optional[FramePacer] = None, max_workers: int = 4):
+        self.pacer = pacer
+        self.max_workers = max_workers
+        self.tasks: dict[str, BootTask] = {}
+        self.results: dict[str, Any] = {}
+        self.failed: dict[str, BaseException] = {}
+    
+    def add(self, name: str, func: Callable, *, depends=(), thread: bool = True) -> BootTask:
+        if name in self.tasks:
+            raise ValueError(f"Boot task already registered: {name}")
+        task = BootTask(name, func, depends, thread)
+        self.tasks[name] = task
+        return task
+    
+    async def _execute(self, task: BootTask, executor: ThreadPoolExecutor):
+        with span(f"boot:{task.name}", thread=task.thread):
+            if task.thread:
+                ctx = contextvars.copy_context()
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, ctx.run, task.func)
+            
+            result = task.func()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+    
+    def _frame(self):
+        if self.pacer is not None:
+            self.pacer.tick()
+    
+    async def run(self) -> dict[str, Any]:
+        for task in self.tasks.values():
+            unknown = [dep for dep in task.depends if dep not in self.tasks]
+            if unknown:
+                raise KeyError(f"Boot task '{task.name}' depends on unknown tasks: {unknown}")
+        
+        pending = dict(self.tasks)
+        running: dict[asyncio.Future, str] = {}
+        interval = self.pacer.interval if self.pacer else None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="boot") as executor:
+            while pending or running:
+                for name, task in list(pending.items()):
+                    broken = [dep for dep in task.depends if dep in self.failed]
+                    if broken:
+                        del pending[name]
+                        self.failed[name] = RuntimeError(f"Dependencies failed: {broken}")
+                        logger.warning(f"Boot task '{name}' skipped, failed dependencies: {broken}")
+                    elif all(dep in self.results for dep in task.depends):
+                        del pending[name]
+                        running[asyncio.ensure_future(self._execute(task, executor))] = name
+                        logger.debug(f"Boot task started: {name}")
+                
+                if not running:
+                    if pending:
+                        logger.error(f"Boot tasks with cyclic dependencies: {list(pending)}")
+                    break
+                
+                finished, _ = await asyncio.wait(
+                    running, timeout=interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                self._frame()
+                
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        self.results[name] = future.result()
+                        logger.debug(f"Boot task finished: {name}")
+                    else:
+                        self.failed[name] = error
+                        logger.error(f"Boot task '{name}' failed: {error}", exc_info=error)
+        
+        return self.results
@@ -0,0 +1,241 @@
+import os
+import enum
+import logging
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer
+from attrs import define, field
+
+from core.config import ConfigCache
+from utils.fs import getAppPath, UrlResolver
+from utils.fs.fs_base import ArchivePool, ListingCache
+
+logger = logging.getLogger(__name__)
+
+# archive suffix -> event kind
+ARCHIVE_KINDS = {".plugin": "plugin", ".overtheme": "theme", ".resource": "resource", ".oaddons": "oaddons"}
+# event kind -> (url scheme, first folder of the url path)
+KIND_URLS = {
+    "plugin": ("plugin", ""),
+    "theme": ("resource", "theme/"),
+    "resource": ("resource", "resource/"),
+    "oaddons": ("resource", "overlay_addons/"),
+    "plugin_data": ("pldata", ""),
+}
+
+
+class MetaSingWatcher(type(QObject)):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class FsChange(enum.StrEnum):
+    ADDED = "added"
+    MODIFIED = "modified"
+    REMOVED = "removed"
+
+
+@define(frozen=True)
+class FsEvent:
+    # plugin, theme, resource, oaddons, config, plugin_data
+    kind: str = field()
+    change: FsChange = field()
+    path: Path = field()
+    # archive or config stem, plugin folder for plugin_data
+    name: str = field()
+
+
+@define
+class _Subscriber:
+    callback: Callable[[list[FsEvent]], None] = field()
+    kinds: Optional[frozenset[str]] = field(default=None)
+
+
+class FsWatcher(QObject, metaclass=MetaSingWatcher):
+    """
+    Watches plugins/, resource/, configs/ and plugins/plugin_data/.
+    Changes are collected for ``delay`` ms after the last one, diffed against a snapshot
+    of each touched folder and published to subscribers as typed FsEvent batches.
+    """
+    
+    def __init__(self, delay: int = 200, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        app = getAppPath()
+        self.folders = {
+            app / "plugins": "archives",
+            app / "resource": "archives",
+            app / "configs": "config",
+            app / "plugins" / "plugin_data": "plugin_data",
+        }
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._touched)
+        self._watcher.fileChanged.connect(self._touched)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._flush)
+        self._dirty: set[Path] = set()
+        self._snapshots: dict[Path, dict[str, tuple[int, int]]] = {}
+        self._subscribers: list[_Subscriber] = []
+    
+    @property
+    def running(self) -> bool:
+        return bool(self._watcher.directories())
+    
+    def subscribe(self, callback: Callable[[list[FsEvent]], None], kinds: Optional[Iterable[str]] = None):
+        """``callback`` gets the events of one debounced batch, optionally only of ``kinds``"""
+        self._subscribers.append(_Subscriber(callback, frozenset(kinds) if kinds else None))
+    
+    def unsubscribe(self, callback: Callable[[list[FsEvent]], None]):
+        self._subscribers = [sub for sub in self._subscribers if sub.callback != callback]
+    
+    def start(self):
+        if self.running:
+            return
+        for folder in self.folders:
+            if not folder.is_dir():
+                continue
+            self._snapshots[folder] = self._scan(folder)
+            self._watch(folder)
+            if self.folders[folder] == "plugin_data":
+                for sub in folder.iterdir():
+                    if sub.is_dir():
+                        self._snapshots[sub] = self._scan(sub)
+                        self._watch(sub)
+        logger.info(f"File watcher started: {len(self._watcher.directories())} folders")
+    
+    def stop(self):
+        self._timer.stop()
+        for paths in (self._watcher.directories(), self._watcher.files()):
+            if paths:
+                self._watcher.removePaths(paths)
+        self._snapshots.clear()
+        self._dirty.clear()
+    
+    def _watch(self, folder: Path):
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        paths = [str(folder)]
+        # in-place rewrites do not always touch the folder itself
+        paths += [str(entry) for entry in folder.iterdir() if entry.is_file()]
+        paths = [path for path in paths if path not in watched]
+        if paths:
+            self._watcher.addPaths(paths)
+    
+    @staticmethod
+    def _scan(folder: Path) -> dict[str, tuple[int, int]]:
+        result = {}
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        result[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+        return result
+    
+    def _touched(self, path: str):
+        path = Path(path)
+        self._dirty.add(path if path in self._snapshots else path.parent)
+        self._timer.start()
+    
+    def _role(self, folder: Path) -> Optional[str]:
+        if folder in self.folders:
+            return self.folders[folder]
+        if folder.parent in self.folders and self.folders[folder.parent] == "plugin_data":
+            return "plugin_data_folder"
+        return None
+    
+    def _event(self, folder: Path, name: str, change: FsChange) -> Optional[FsEvent]:
+        path = folder / name
+        match self._role(folder):
+            case "archives":
+                kind = ARCHIVE_KINDS.get(path.suffix)
+                return FsEvent(kind, change, path, path.stem) if kind else None
+            case "config":
+                return FsEvent("config", change, path, path.stem)
+            case "plugin_data_folder":
+                return FsEvent("plugin_data", change, path, folder.name)
+        return None
+    
+    def _flush(self):
+        dirty, self._dirty = self._dirty, set()
+        events = []
+        for folder in dirty:
+            before = self._snapshots.get(folder)
+            if before is None:
+                continue
+            after = self._scan(folder)
+            self._snapshots[folder] = after
+            
+            changes = [(name, FsChange.ADDED) for name in after.keys() - before.keys()]
+            changes += [(name, FsChange.REMOVED) for name in before.keys() - after.keys()]
+            changes += [(name, FsChange.MODIFIED) for name in after.keys() & before.keys() if after[name] != before[name]]
+            for name, change in changes:
+                event = self._event(folder, name, change)
+                if event is not None:
+                    events.append(event)
+            
+            if folder.is_dir():
+                self._watch(folder)
+            if self._role(folder) == "plugin_data":
+                self._syncPluginData(folder)
+        
+        if events:
+            self._publish(events)
+    
+    def _syncPluginData(self, folder: Path):
+        """Plugin folders come and go with plugins"""
+        for sub in folder.iterdir():
+            if sub.is_dir() and sub not in self._snapshots:
+                self._snapshots[sub] = self._scan(sub)
+                self._watch(sub)
+        for sub in [sub for sub in self._snapshots if sub.parent == folder and not sub.exists()]:
+            del self._snapshots[sub]
+    
+    def _publish(self, events: list[FsEvent]):
+        logger.info(f"File changes: {', '.join(f'{e.kind}:{e.name} {e.change}' for e in events)}")
+        for sub in list(self._subscribers):
+            batch = events if sub.kinds is None else [event for event in events if event.kind in sub.kinds]
+            if not batch:
+                continue
+            try:
+                sub.callback(batch)
+            except Exception as e:
+                logger.error(f"File change subscriber failed: {e}", exc_info=True)
+
+
+def evictArchives(events: list[FsEvent]):
+    """Drops pooled handles and resolved urls of changed archives and plugin data folders"""
+    for event in events:
+        if event.kind in ARCHIVE_KINDS.values():
+            ArchivePool().release(str(event.path))
+            if event.change != FsChange.MODIFIED:
+                ListingCache().invalidate(str(event.path.parent))
+        scheme, folder = KIND_URLS[event.kind]
+        UrlResolver().invalidate(scheme, f"{folder}{event.name}")
+
+
+def evictConfigs(events: list[FsEvent]):
+    """Makes Config instances read changed files of configs/ and configs of changed archives again"""
+    for event in events:
+        if event.kind == "config":
+            # configs/ is not an archive kind and has no entry in KIND_URLS
+            ConfigCache().invalidate(f"project://configs/{event.path.name}")
+            continue
+        scheme, folder = KIND_URLS[event.kind]
+        ConfigCache().invalidate(f"{scheme}://{folder}{event.name}/")
+
+
+def watchAppFolders() -> FsWatcher:
+    """Starts the watcher with the built-in cache subscribers"""
+    watcher = FsWatcher()
+    watcher.subscribe(evictArchives, kinds=KIND_URLS)
+    watcher.subscribe(evictConfigs, kinds=("plugin", "theme", "config"))
+    watcher.start()
+    return watcher
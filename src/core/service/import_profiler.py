@@ -0,0 +1,326 @@
+import os
+import sys
+import json
+import time
+import builtins
+import importlib
+import importlib.abc
+import sysconfig
+import threading
+import logging
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+from attrs import define, field, asdict
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "OVERLAY_PROFILE_IMPORTS"
+PROFILE_FLAG = "--profile-imports"
+
+GROUPS = ("core", "tools", "plugin", "theme", "addon", "third-party", "stdlib", "builtin")
+
+
+class MetaSingProfiler(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+@define
+class ImportRecord:
+    name: str = field()
+    group: str = field()
+    self_ms: float = field()
+    cumulative_ms: float = field()
+    # sys.path entries checked before the module was found (top-level imports only)
+    scanned: int = field(default=0)
+    entry: Optional[str] = field(default=None)
+    found: bool = field(default=True)
+    thread: str = field(default="")
+
+
+class _Frame:
+    __slots__ = ("name", "start", "children", "modules", "existed")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter_ns()
+        self.children = 0
+        # names the import system looked up for this import on this thread, in order
+        self.modules: list[str] = []
+        self.existed = name in sys.modules
+
+
+class _ImportWatcher(importlib.abc.MetaPathFinder):
+    """
+    First finder of sys.meta_path: finds nothing, only notes the names looked up by the
+    current thread, so modules of imports running in other threads are not mixed in.
+    """
+    
+    def __init__(self, profiler: "ImportProfiler"):
+        self.profiler = profiler
+    
+    def find_spec(self, fullname, path=None, target=None):
+        stack = getattr(self.profiler._local, "stack", None)
+        if stack:
+            stack[-1].modules.append(fullname)
+        return None
+
+
+class ImportProfiler(metaclass=MetaSingProfiler):
+    """
+    In-process analogue of ``-X importtime``.
+    While installed, wraps ``__import__`` and ``importlib.import_module`` and attributes
+    the time of each new module to its origin: app core, tools/ site dirs, plugin, theme
+    and addon archives, third-party packages or stdlib.
+    Enabled at startup with ``OVERLAY_PROFILE_IMPORTS=<file>`` or ``--profile-imports[=<file>]``.
+    """
+    
+    def __init__(self):
+        self.records: list[ImportRecord] = []
+        self.output: Optional[Path] = None
+        self.enabled = self._resolve_output()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._original_import = None
+        self._original_import_module = None
+        self._watcher = _ImportWatcher(self)
+        
+        # utils.fs is not imported here: the profiler is installed before the app modules
+        app = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(os.getcwd())
+        self._roots = [
+            (str(app / "tools"), "tools"),
+            (str(app / "plugins"), "plugin"),
+            (str(Path(__file__).resolve().parents[2]), "core"),
+            (sysconfig.get_paths()["purelib"], "third-party"),
+            (sysconfig.get_paths()["platlib"], "third-party"),
+            (sysconfig.get_paths()["stdlib"], "stdlib"),
+        ]
+    
+    def _resolve_output(self) -> bool:
+        for arg in list(sys.argv[1:]):
+            if arg == PROFILE_FLAG or arg.startswith(f"{PROFILE_FLAG}="):
+                sys.argv.remove(arg)
+                _, _, value = arg.partition("=")
+                self.output = Path(value) if value else None
+                return True
+        
+        value = os.environ.get(PROFILE_ENV)
+        if not value:
+            return False
+        if value.lower() not in ("1", "true", "yes"):
+            self.output = Path(value)
+        return True
+    
+    @property
+    def installed(self) -> bool:
+        return self._original_import is not None
+    
+    def install(self):
+        if self.installed:
+            return
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        builtins.__import__ = self._wrap(self._original_import)
+        importlib.import_module = self._wrap(self._original_import_module)
+        sys.meta_path.insert(0, self._watcher)
+        logger.info("Import profiler installed")
+    
+    def uninstall(self):
+        if not self.installed:
+            return
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+        if self._watcher in sys.meta_path:
+            sys.meta_path.remove(self._watcher)
+        self._original_import = None
+        self._original_import_module = None
+    
+    def _stack(self) -> list[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def _wrap(self, func):
+        @wraps(func)
+        def inner(name, *args, **kwargs):
+            # already imported: no new modules to attribute
+            if name in sys.modules and not (len(args) > 2 and args[2]):
+                return func(name, *args, **kwargs)
+            with self.measure(name):
+                return func(name, *args, **kwargs)
+        
+        return inner
+    
+    def measure(self, name: str):
+        """Attributes modules created inside the block to ``name`` (archive imports use it directly)."""
+        if not self.installed:
+            return nullcontext()
+        return self._measure(name)
+    
+    def _watchFirst(self):
+        # finders inserted at the front later (OverlayAddonsImporter) would hide their modules
+        meta_path = sys.meta_path
+        if not meta_path or meta_path[0] is not self._watcher:
+            try:
+                meta_path.remove(self._watcher)
+            except ValueError:
+                pass
+            meta_path.insert(0, self._watcher)
+    
+    @contextmanager
+    def _measure(self, name: str):
+        self._watchFirst()
+        stack = self._stack()
+        frame = _Frame(name)
+        stack.append(frame)
+        found = True
+        try:
+            yield
+        except ImportError:
+            found = False
+            raise
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter_ns() - frame.start
+            if stack:
+                stack[-1].children += elapsed
+            self._record(frame, elapsed, found)
+    
+    def _record(self, frame: _Frame, elapsed: int, found: bool):
+        # looked-up names that were created; archive importers create the module without a lookup
+        new = [module for module in dict.fromkeys(frame.modules) if module in sys.modules]
+        if not frame.existed and frame.name in sys.modules and frame.name not in new:
+            new.insert(0, frame.name)
+        if not new and found:
+            return
+        
+        # parents are looked up before their submodules, so new[0] is the one requested
+        name = frame.name if frame.name in new or not new else new[0]
+        module = sys.modules.get(name)
+        group, entry = self._origin(name, module)
+        scanned = 0
+        if "." not in name:
+            scanned = self._scanned(entry) if found else len(sys.path)
+        
+        record = ImportRecord(
+            name=name,
+            group=group,
+            self_ms=(elapsed - frame.children) / 1e6,
+            cumulative_ms=elapsed / 1e6,
+            scanned=scanned,
+            entry=entry,
+            found=found,
+            thread=threading.current_thread().name,
+        )
+        with self._lock:
+            self.records.append(record)
+    
+    def _origin(self, name: str, module) -> tuple[str, Optional[str]]:
+        file = getattr(module, "__file__", None)
+        if name.startswith("OExtension") or (file and ".oaddons" in file):
+            group = "addon"
+        elif file and ".overtheme" in file:
+            group = "theme"
+        elif file and ".plugin" in file:
+            group = "plugin"
+        elif not file:
+            group = "builtin"
+        else:
+            group = next((group for root, group in self._roots if file.startswith(root)), "third-party")
+        return group, self._entry(file)
+    
+    @staticmethod
+    def _entry(file: Optional[str]) -> Optional[str]:
+        """sys.path entry the file was found under (the longest match)."""
+        if not file:
+            return None
+        matches = [item for item in sys.path if file.startswith(os.path.abspath(item or ".") + os.sep)]
+        return max(matches, key=len, default=None)
+    
+    @staticmethod
+    def _scanned(entry: Optional[str]) -> int:
+        if entry is None:
+            # served by a meta path finder (builtin, frozen, OExtension)
+            return 0
+        try:
+            return sys.path.index(entry) + 1
+        except ValueError:
+            return 0
+    
+    def report(self, top: int = 20) -> dict:
+        with self._lock:
+            records = list(self.records)
+        
+        groups = {}
+        for record in records:
+            group = groups.setdefault(record.group, {"modules": 0, "self_ms": 0.0})
+            group["modules"] += 1
+            group["self_ms"] += record.self_ms
+        
+        # entries that were checked without a match before the one that served the import
+        path_misses: dict[str, int] = {}
+        for record in records:
+            if record.scanned:
+                for item in sys.path[:record.scanned - (1 if record.found else 0)]:
+                    path_misses[item] = path_misses.get(item, 0) + 1
+        
+        return {
+            "total_ms": sum(record.self_ms for record in records),
+            "modules": len(records),
+            "scanned": sum(record.scanned for record in records),
+            "groups": {
+                name: {**groups[name], "self_ms": round(groups[name]["self_ms"], 3)}
+                for name in GROUPS if name in groups
+            },
+            "top": [asdict(record) for record in sorted(records, key=lambda r: r.self_ms, reverse=True)[:top]],
+            "sys_path": [{"entry": item, "misses": path_misses.get(item, 0)} for item in sys.path],
+        }
+    
+    def format(self, top: int = 20) -> str:
+        report = self.report(top)
+        lines = [
+            f"Imports: {report['modules']} modules, {report['total_ms']:.1f} ms, "
+            f"{report['scanned']} sys.path entries scanned"
+        ]
+        for name, group in report["groups"].items():
+            lines.append(f"  {name:<12} {group['modules']:>5} modules {group['self_ms']:>9.1f} ms")
+        lines.append(f"Top {top}:")
+        for record in report["top"]:
+            lines.append(
+                f"  {record['self_ms']:>8.1f} ms | {record['cumulative_ms']:>8.1f} ms | "
+                f"{record['group']:<11} | {record['name']}"
+            )
+        return "\n".join(lines)
+    
+    def dump(self, path: Optional[Path] = None, top: int = 50) -> Optional[Path]:
+        path = path or self.output
+        if path is None:
+            return None
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(self.report(top), file, ensure_ascii=False, indent=2)
+            logger.info(f"Import profile written: {path}")
+            return path
+        except Exception as e:
+            logger.error(f"Failed to write import profile '{path}': {e}", exc_info=True)
+            return None
+    
+    def finish(self, top: int = 20):
+        """Stops profiling, logs the top offenders and writes the report if an output is set."""
+        if not self.installed:
+            return
+        self.uninstall()
+        logger.info(self.format(top))
+        self.dump()
+
+
+def measure(name: str):
+    return ImportProfiler().measure(name)
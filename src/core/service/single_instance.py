@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import atexit
+import socket
+import secrets
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Optional
+
+# Only stdlib here: a second launch has to get in and out before Qt is imported
+logger = logging.getLogger(__name__)
+
+LOCK_FILE = "instance.lock"
+INFO_FILE = "instance.json"
+
+
+class MetaSingInstance(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+def _lock(fd: int) -> bool:
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def intentFromArgv(argv: list[str]) -> str:
+    """
+    Launch intent in the websocket command format:
+    ``--action <name>`` -> ``action <name>``, ``--cli <interface> [args]`` -> ``cli ...``, otherwise ``show``.
+    The flags are removed from argv.
+    """
+    for flag, command in (("--action", "action"), ("--cli", "cli")):
+        if flag in argv:
+            index = argv.index(flag)
+            args = argv[index + 1:] if command == "cli" else argv[index + 1:index + 2]
+            del argv[index:index + 1 + len(args)]
+            return " ".join([command, *args])
+    return "show"
+
+
+class SingleInstance(metaclass=MetaSingInstance):
+    """
+    One Overlay per app folder.
+    The first launch holds an OS lock on .cache/instance.lock (released by the OS if the process dies)
+    and listens on a loopback socket; later launches forward their intent there and exit.
+    """
+    
+    def __init__(self, root: Optional[Path] = None):
+        app = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(os.getcwd())
+        self.root = root or (app / ".cache")
+        self.primary = False
+        self._fd: Optional[int] = None
+        self._server: Optional[socket.socket] = None
+        self._token = secrets.token_hex(16)
+        self._handler: Optional[Callable[[str], None]] = None
+        self._pending: list[str] = []
+        self._lock = threading.Lock()
+    
+    @property
+    def info_path(self) -> Path:
+        return self.root / INFO_FILE
+    
+    def acquire(self) -> bool:
+        """Takes the instance lock. Returns False if another Overlay holds it."""
+        if self.primary:
+            return True
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.root / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+        if not _lock(fd):
+            os.close(fd)
+            return False
+        
+        self._fd = fd
+        self.primary = True
+        try:
+            self._listen()
+        except OSError as e:
+            logger.error(f"Single instance channel is not available: {e}", exc_info=True)
+        atexit.register(self.release)
+        return True
+    
+    def _listen(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        port = self._server.getsockname()[1]
+        
+        tmp = self.info_path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"pid": os.getpid(), "port": port, "token": self._token}, file)
+        os.replace(tmp, self.info_path)
+        
+        threading.Thread(target=self._serve, name="single-instance", daemon=True).start()
+        logger.info(f"Single instance channel listening on 127.0.0.1:{port}")
+    
+    def _serve(self):
+        while self._server is not None:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break
+            with connection:
+                connection.settimeout(2.0)
+                try:
+                    request = json.loads(connection.makefile("rb").readline(1 << 16))
+                    if request.get("token") != self._token:
+                        reply = {"status": "error", "message": "bad token"}
+                    else:
+                        self._dispatch(str(request["message"]))
+                        reply = {"status": "ok"}
+                except Exception as e:
+                    logger.warning(f"Bad single instance request: {e}")
+                    reply = {"status": "error", "message": str(e)}
+                try:
+                    connection.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                except OSError:
+                    pass
+    
+    def _dispatch(self, message: str):
+        with self._lock:
+            handler = self._handler
+            if handler is None:
+                self._pending.append(message)
+                return
+        logger.info(f"Forwarded launch intent: {message}")
+        handler(message)
+    
+    def post(self, message: str):
+        """Queues an intent of this very launch, delivered like forwarded ones."""
+        self._dispatch(message)
+    
+    def setHandler(self, handler: Callable[[str], None]):
+        """The handler runs on the listener thread. Intents received before it was set are delivered now."""
+        with self._lock:
+            self._handler = handler
+            pending, self._pending = self._pending, []
+        for message in pending:
+            handler(message)
+    
+    def forward(self, message: str, timeout: float = 2.0) -> Optional[dict]:
+        """Sends an intent to the running instance. Returns its reply or None."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                info = json.loads(self.info_path.read_text(encoding="utf-8"))
+                with socket.create_connection(("127.0.0.1", info["port"]), timeout=timeout) as connection:
+                    payload = {"token": info["token"], "message": message}
+                    connection.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+                    return json.loads(connection.makefile("rb").readline(1 << 16))
+            except (OSError, ValueError, KeyError) as e:
+                # the running instance may still be writing its channel info
+                if time.monotonic() >= deadline:
+                    logger.warning(f"Running instance did not answer: {e}")
+                    return None
+                time.sleep(0.05)
+    
+    def release(self):
+        if not self.primary:
+            return
+        self.primary = False
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+        try:
+            self.info_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def forwardToRunning(argv: list[str]) -> Optional[int]:
+    """
+    Fast path for a second launch: forwards the intent to the running Overlay and returns the exit code.
+    Returns None when this launch takes the lock (a non-default intent is queued for itself).
+    """
+    instance = SingleInstance()
+    intent = intentFromArgv(argv)
+    if instance.acquire():
+        if intent != "show":
+            instance.post(intent)
+        return None
+    
+    reply = instance.forward(intent)
+    if reply is None:
+        print("Overlay is already running but does not respond", file=sys.stderr)
+        return 1
+    if reply.get("status") != "ok":
+        print(f"Overlay rejected '{intent}': {reply.get('message')}", file=sys.stderr)
+        return 1
+    return 0
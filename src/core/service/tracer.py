@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import time
+import inspect
+import threading
+import logging
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = "OVERLAY_TRACE"
+TRACE_FLAG = "--trace"
+DEFAULT_TRACE_FILE = "overlay_trace.json"
+
+
+class MetaSingTracer(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class BootTracer(metaclass=MetaSingTracer):
+    """
+    Records wall/CPU time of boot phases and writes them as a Chrome trace
+    (chrome://tracing, ui.perfetto.dev).
+    Enabled with ``OVERLAY_TRACE=<file>`` or ``--trace[=<file>]``.
+    """
+    
+    def __init__(self):
+        self._events: list[dict] = []
+        self._threads: dict[int, str] = {}
+        self._open: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self.output: Optional[Path] = self._resolve_output()
+        
+        if self.enabled:
+            logger.info(f"Boot tracer enabled. Output: {self.output}")
+    
+    @property
+    def enabled(self) -> bool:
+        return self.output is not None
+    
+    @staticmethod
+    def _resolve_output() -> Optional[Path]:
+        for arg in list(sys.argv[1:]):
+            if arg == TRACE_FLAG or arg.startswith(f"{TRACE_FLAG}="):
+                sys.argv.remove(arg)
+                _, _, value = arg.partition("=")
+                return Path(value or DEFAULT_TRACE_FILE)
+        
+        value = os.environ.get(TRACE_ENV)
+        if not value:
+            return None
+        if value.lower() in ("1", "true", "yes"):
+            return Path(DEFAULT_TRACE_FILE)
+        return Path(value)
+    
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin) / 1000
+    
+    @contextmanager
+    def _record(self, name: str, category: str, args: dict):
+        thread = threading.current_thread()
+        start_wall = self._now_us()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            duration = self._now_us() - start_wall
+            cpu_ms = (time.thread_time() - start_cpu) * 1000
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_wall,
+                "dur": duration,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": {**args, "cpu_ms": round(cpu_ms, 3)},
+            }
+            with self._lock:
+                self._events.append(event)
+                self._threads.setdefault(thread.ident, thread.name)
+    
+    def span(self, name: str, category: str = "boot", **args):
+        """Context manager measuring the enclosed block."""
+        if not self.enabled:
+            return nullcontext()
+        return self._record(name, category, args)
+    
+    def begin(self, name: str, category: str = "boot", **args):
+        """Opens a span that is closed later by ``end`` (for phases not bound to one block)."""
+        if not self.enabled:
+            return
+        record = self._record(name, category, args)
+        record.__enter__()
+        self._open[name] = record
+    
+    def end(self, name: str):
+        record = self._open.pop(name, None)
+        if record is not None:
+            record.__exit__(None, None, None)
+    
+    def traced(self, name: Optional[str] = None, category: str = "boot"):
+        """Decorator measuring every call of a function or coroutine function."""
+        
+        def wrapper(func: Callable):
+            span_name = name or func.__qualname__
+            
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def inner(*args, **kwargs):
+                    with self.span(span_name, category):
+                        return await func(*args, **kwargs)
+            else:
+                @wraps(func)
+                def inner(*args, **kwargs):
+                    with self.span(span_name, category):
+                        return func(*args, **kwargs)
+            
+            return inner
+        
+        return wrapper
+    
+    def events(self) -> list[dict]:
+        with self._lock:
+            return list(self._events)
+    
+    def dump(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Writes collected spans in Chrome Trace Event format."""
+        path = path or self.output
+        if path is None:
+            return None
+        
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": tname}}
+                for tid, tname in self._threads.items()
+            ]
+            trace: dict[str, Any] = {
+                "traceEvents": metadata + list(self._events),
+                "displayTimeUnit": "ms",
+            }
+        
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(trace, file, ensure_ascii=False)
+            logger.info(f"Boot trace written: {path} ({len(trace['traceEvents'])} events)")
+            return path
+        except Exception as e:
+            logger.error(f"Failed to write boot trace '{path}': {e}", exc_info=True)
+            return None
+
+
+def span(name: str, category: str = "boot", **args):
+    return BootTracer().span(name, category, **args)
+
+
+def traced(name: Optional[str] = None, category: str = "boot"):
+    return BootTracer().traced(name, category)
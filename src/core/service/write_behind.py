@@ -0,0 +1,147 @@
+import time
+import weakref
+import threading
+import logging
+from contextlib import contextmanager
+from concurrent.futures import Future, wait
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from ldt import NexusStore
+
+from utils.fs.aio import ioExecutor
+
+logger = logging.getLogger(__name__)
+
+_writers: "weakref.WeakSet[WriteBehind]" = weakref.WeakSet()
+
+
+class WriteBehind(QObject):
+    """
+    Debounced ``sync()`` of a NexusStore on the I/O pool.
+    Changes mark keys dirty and restart a ``delay`` ms timer, so a burst of changes is one write;
+    a write happens at most ``max_delay`` ms after the first change of a burst.
+    Changes made inside ``edit()`` never overlap a write in progress.
+    A failed write is retried with a growing delay, ``retries`` times, then only after the next change.
+    """
+    
+    _written = Signal(object)
+    retries = 5
+    max_backoff = 30000
+    
+    def __init__(self, store: NexusStore, name: str, delay: int = 500, max_delay: int = 3000,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.store = store
+        self.name = name
+        self.max_delay = max_delay / 1000
+        self._lock = threading.RLock()
+        self._dirty: set[str] = set()
+        self._since: Optional[float] = None
+        self._future: Optional[Future] = None
+        self._failures = 0
+        self._delay = delay
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._flush)
+        self._written.connect(self._onWritten)
+        self.requests = 0
+        self.writes = 0
+        _writers.add(self)
+    
+    @property
+    def pending(self) -> bool:
+        return bool(self._dirty) or self._future is not None
+    
+    def setDelay(self, delay: int):
+        self._delay = max(0, int(delay))
+        self._timer.setInterval(self._delay)
+    
+    @contextmanager
+    def edit(self, key: str = ""):
+        """
+        Changes of the store inside are not written half-done and are scheduled on exit.
+        The lock is the one a background write holds during ``sync()``, so entering waits for
+        a write in progress: keep the block short and do slow work before it.
+        """
+        with self._lock:
+            yield self.store
+        self.schedule(key)
+    
+    def schedule(self, key: str = ""):
+        """Marks ``key`` (or the whole store) dirty and (re)starts the debounce"""
+        self.requests += 1
+        self._dirty.add(key)
+        if self._since is None:
+            self._since = time.monotonic()
+        if time.monotonic() - self._since >= self.max_delay:
+            self._flush()
+        else:
+            self._timer.start(self._delay)
+    
+    def _flush(self):
+        self._timer.stop()
+        if not self._dirty or self._future is not None:
+            # a write in progress picks up the rest when it is done
+            return
+        keys, self._dirty, self._since = self._dirty, set(), None
+        future = self._future = ioExecutor().submit(self._write)
+        # the future travels with the signal: a write flush() already waited for is told apart
+        future.add_done_callback(lambda done: self._written.emit((done, keys)))
+    
+    def _write(self):
+        with self._lock:
+            self.store.sync()
+    
+    def _onWritten(self, result):
+        future, keys = result
+        if future is not self._future:
+            # flush() waited for this write and wrote the store after it
+            return
+        self._future = None
+        error = future.exception()
+        if error is None:
+            self._failures = 0
+            self.writes += 1
+            logger.debug(f"{self.name} written: {len(keys)} keys, {self.requests} requests, {self.writes} writes")
+        else:
+            self._failures += 1
+            self._dirty |= keys
+            if self._failures > self.retries:
+                logger.error(f"Failed to write {self.name}, retrying after the next change: {error}")
+                return
+            logger.error(f"Failed to write {self.name}, retry {self._failures}/{self.retries}: {error}")
+        if self._dirty:
+            self._since = self._since or time.monotonic()
+            backoff = self._delay * 2 ** self._failures if self._failures else self._delay
+            self._timer.start(min(backoff, self.max_backoff))
+    
+    def flush(self):
+        """Writes now on the calling thread, after a write in progress"""
+        self._timer.stop()
+        future, self._future = self._future, None
+        if future is not None:
+            # its late _onWritten sees another future and is ignored
+            wait([future])
+        with self._lock:
+            self.store.sync()
+        self._dirty.clear()
+        self._since = None
+        self._failures = 0
+        self.writes += 1
+    
+    def stats(self) -> dict:
+        return {"requests": self.requests, "writes": self.writes, "dirty": len(self._dirty),
+                "failures": self._failures}
+
+
+def flushAll():
+    """Writes every store with pending changes; called on shutdown"""
+    for writer in list(_writers):
+        if not writer.pending:
+            continue
+        try:
+            writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush {writer.name}: {e}", exc_info=True)
@@ -2,10 +2,12 @@ import logging
 import io
 from pathlib import Path
 
-from PySide6.QtCore import QFile, QIODevice, QTextStream, QDirIterator, QFileInfo
+from PySide6.QtCore import QDirIterator, QFileInfo
 
 from ldt.io_drives.drivers import BaseDriver
 
+from utils.fs.fs_qt import QResourceReader
+
 # Setup standard logger
 logger = logging.getLogger(__name__)
 
@@ -52,22 +54,22 @@ class QRCLoader(BaseLoader):
         if not self._valid: return {}
         path = f"{self.base_path}{lang}.{self.ext}"
         
-        qfile = QFile(path)
         data = {}
         
-        if qfile.open(QIODevice.ReadOnly | QIODevice.Text):
+        try:
+            reader = QResourceReader(path)
+        except Exception:
+            # File exists in list but cannot be opened (rare)
+            logger.warning(f"Could not open QRC file: {path}")
+            return data
+        
+        # Decoded while parsing, straight from the resource data
+        with io.TextIOWrapper(reader, encoding="utf-8") as stream:
             try:
-                # Read QRC file to string stream
-                stream = io.StringIO(QTextStream(qfile).readAll())
                 data = self.driver.read_stream(stream)
             except Exception as e:
                 # Log parsing errors with traceback
                 logger.error(f"Failed to parse QRC file '{path}': {e}", exc_info=True)
-            finally:
-                qfile.close()
-        else:
-            # File exists in list but cannot be opened (rare)
-            logger.warning(f"Could not open QRC file: {path}")
         
         return data
 
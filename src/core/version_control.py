@@ -1,6 +1,8 @@
 import logging
 from core.default_configs import *
+from .config import ConfigCache
 from .metadata import MetaDataFinder, registry, MetaData
+from .loaders.archive_index import ArchiveIndex
 
 logger = logging.getLogger(__name__)
 
@@ -8,31 +10,23 @@ logger = logging.getLogger(__name__)
 @registry
 class OverlayDataFinder(MetaDataFinder):
     _conversion_table_ = {"App": ("App", "apps")}
+    _archive_kinds = {"plugins": "plugin", "theme": "overtheme"}
+    _schemes = {"plugins": PluginConfig, "apps": AppConfig, "theme": ThemeConfig}
     
     @staticmethod
-    def _get_data(type_, name):
-        """Reads configuration file content."""
-        try:
-            path = ""
-            match type_:
-                case "plugins":
-                    path = f"plugin://{name}/plugin.toml"
-                case "apps":
-                    path = "qt://app/overlay.toml"
-                case "theme":
-                    path = f"resource://theme/{name}/theme.toml"
-            
-            if path:
-                with open(path, encoding="utf-8") as f:
-                    return f.read()
-        
-        except FileNotFoundError:
-            logger.debug(f"Config file not found: {type_}/{name}")
-            return None
-        except Exception as e:
-            logger.error(f"Error reading config for {type_}/{name}: {e}", exc_info=True)
-            return None
-        
+    def _url(type_, name) -> str:
+        match type_:
+            case "plugins":
+                return f"plugin://{name}/plugin.toml"
+            case "apps":
+                return "qt://app/overlay.toml"
+            case "theme":
+                return f"resource://theme/{name}/theme.toml"
+        return ""
+    
+    def stamp(self, context: "MetaDataFinder.Context"):
+        if context.type in self._archive_kinds:
+            return ArchiveIndex().stamp(self._archive_kinds[context.type], context.name)
         return None
     
     def find_metadata(self, context: "MetaDataFinder.Context") -> MetaData:
@@ -42,18 +36,20 @@ class OverlayDataFinder(MetaDataFinder):
         logger.debug(f"Finding metadata for: type={context.type}, name={context.name}")
         
         try:
-            raw_data = self._get_data(context.type, context.name)
-            if not raw_data:
-                return None
+            if context.type in self._archive_kinds:
+                md = ArchiveIndex().metadata(self._archive_kinds[context.type], context.name)
+                if md is not None:
+                    return md
             
-            match context.type:
-                case "plugins":
-                    return PluginConfig.from_toml(raw_data).metadata
-                case "apps":
-                    return AppConfig.from_toml(raw_data).metadata
-                case "theme":
-                    return ThemeConfig.from_toml(raw_data).metadata
+            url = self._url(context.type, context.name)
+            if not url:
+                return None
+            # a repeated lookup only gets here after the source stamp changed
+            return ConfigCache().get(url, self._schemes[context.type], fresh=True).metadata
         
+        except FileNotFoundError:
+            logger.debug(f"Config file not found: {context.type}/{context.name}")
+            return None
         except Exception as e:
             logger.warning(f"Failed to parse metadata for {context.type}/{context.name}: {e}")
             return None
@@ -1,5 +1,7 @@
 import asyncio
 import sys
+import time
+from functools import partial
 import typing
 import logging
 from typing import Optional, Iterator
@@ -14,7 +16,8 @@ from PySide6.QtGui import QKeyEvent, QAction
 from ldt import NexusStore, extra
 
 from core.application import OverlayApplication
-from utils.fs import getAppPath
+from utils import codecs
+from utils.fs import getAppPath, UrlResolver
 from core.loaders import PluginLoader, ThemeLoader, OverlayAddonsLoader
 from core.config import Config
 from core.cli import CLInterface
@@ -32,6 +35,10 @@ from core.service.websocket_server import AppServerControl
 from core.metadata import version, metadata
 from uis.main_ui import Ui_MainWindow
 from core.hotkey_manager import HotkeyManager
+from core.service.tracer import traced, span
+from core.service.boot_scheduler import BootScheduler, FramePacer
+from core.service.fs_watcher import watchAppFolders
+from core.service.write_behind import WriteBehind, flushAll
 
 if typing.TYPE_CHECKING:
     from gui.splash_screen import GifSplashScreen
@@ -53,7 +60,9 @@ PluginWidget: typing.TypeAlias = OWidget | OWindow
 class Overlay(QMainWindow, Ui_MainWindow):
     handled_global_shortkey = Signal(str)
     finished_loading = Signal()
+    instance_message = Signal(str)
     
+    @traced("Overlay.__init__")
     def __init__(self, splash: "GifSplashScreen"):
         super().__init__()
         
@@ -64,6 +73,7 @@ class Overlay(QMainWindow, Ui_MainWindow):
             self.flagsInstaller.install(Qt.WindowType.Window)
             
             self._load_generator: Optional[Iterator] = None
+            self._frame_pacer = FramePacer(QCoreApplication.processEvents)
             self.setObjectName("OverlayMain")
             self.setupUi(self)
             
@@ -81,6 +91,19 @@ class Overlay(QMainWindow, Ui_MainWindow):
             logger.debug(f"Loading settings from {settings_path}")
             self.settings = NexusStore(settings_path, extra.TomlDriver())
             self.settings.sync()
+            # checkbox toggles and dialog saves are written in batches off the UI thread
+            save_delay = self.settings.value("fs.save_delay_ms", 500)
+            self.settingsWriter = WriteBehind(self.settings, "settings.toml", save_delay, parent=self)
+            PreLoader.configsWriter().setDelay(save_delay)
+            
+            self.pluginLoader.lazy = bool(self.settings.value("plugins.lazy_import", False))
+            UrlResolver().resize(self.settings.value("fs.resolver_cache_size", 64))
+            codecs.trySetCodec("toml", self.settings.value("codecs.toml", codecs.codec("toml").name))
+            # Active plugins are built after the splash, a few per event loop iteration
+            self.progressive = bool(self.settings.value("plugins.progressive_activation", False))
+            self.activation_budget = self.settings.value("plugins.activation_budget_ms", 8) / 1000
+            self._deferred: list[PluginItem] = []
+            self._deferred_total = 0
             
             lang = self.settings.value("language", "en")
             OverlayApplication.set_language(lang)
@@ -100,6 +123,12 @@ class Overlay(QMainWindow, Ui_MainWindow):
             self.webSocketIn = AppServerControl(self.settings.value("websockets.in"), self)
             self.webSocketIn.action_triggered.connect(self.handler_websockets_shortcut)
             self.webSocketIn.call_cli.connect(self.cliRunner)
+            self.instance_message.connect(self.handler_instance_message)
+            self.finished_loading.connect(self.startDeferredActivation)
+            self.finished_loading.connect(self.pluginLoader.pruneBytecode)
+            # Changed archives and configs evict only their own cache entries
+            if self.settings.value("fs.watch", True):
+                self.finished_loading.connect(self.startWatching)
             
             # Layout Setup
             self.box = AnchorLayout()
@@ -195,43 +224,39 @@ class Overlay(QMainWindow, Ui_MainWindow):
     
     async def update_status(self, text, **context):
         try:
-            self._splash.setStatus(await OverlayApplication.atext(text, **context), metadata("App").author)
-            for _ in range(20):
-                QCoreApplication.processEvents()
-                await asyncio.sleep(0.02)
-            await asyncio.sleep(0.01)
+            self._splash.setStatus(OverlayApplication.text(text, **context), metadata("App").author)
+            self._frame_pacer.tick()
+            await asyncio.sleep(0)
         except Exception as e:
             logger.error(f"Error updating status: {e}", exc_info=True)
     
+    @traced("Overlay.ready")
     async def ready(self):
-        """Sequential loading process"""
+        """Dependency-driven loading process"""
         try:
             logger.info("Starting async resource loading...")
             await self.update_status("screen.load_resource")
             
-            await asyncio.to_thread(PreLoader.loadConfigs)
-            await asyncio.to_thread(self.pluginLoader.load)
-            
-            await self.updateDataPlugins()
-            await asyncio.sleep(0.02)
-            
-            await self.update_status("screen.load_theme")
-            self.loadTheme()
-            await asyncio.sleep(0.02)
-            
-            for type_name, loader_cls in PreLoader.instances.items():
-                group_name = f"{type_name}s"
-                for target, item in loader_cls.load_group(group_name, self.settings, self):
-                    await asyncio.sleep(0.02)
-                    await self.update_status("screen.load_plugin", plugin_name=item.save_name)
-                    if target:
-                        self.setWidgetMemory(item.save_name, target)
-                    if item:
-                        self.listPlugins.addItem(item)
-                    await asyncio.sleep(0.01)
+            theme_name = self.settings.value("theme")
+            self.interface["ThemeCLI"] = ThemeCLI(self.themeLoader)
             
-            self.settingWidget.restore_setting(self.settings)
-            await asyncio.sleep(0.01)
+            async def apply_theme():
+                await self.update_status("screen.load_theme")
+                self.loadTheme()
+            
+            scheduler = BootScheduler(self._frame_pacer)
+            # Worker threads: no widgets are touched here
+            scheduler.add("configs", PreLoader.loadConfigs)
+            scheduler.add("plugins", self.pluginLoader.load)
+            scheduler.add("theme_resolve", partial(self.interface["ThemeCLI"].resolve, theme_name))
+            # UI thread
+            scheduler.add("plugins_data", self.updateDataPlugins, depends=["plugins"], thread=False)
+            scheduler.add("theme", apply_theme, depends=["theme_resolve"], thread=False)
+            scheduler.add("widgets", self.loadWidgets, depends=["configs", "plugins_data", "theme"], thread=False)
+            scheduler.add(
+                "settings", partial(self.settingWidget.restore_setting, self.settings), depends=["widgets"], thread=False
+            )
+            await scheduler.run()
             
             logger.info("Loading finished successfully")
             self.finished_loading.emit()
@@ -239,6 +264,61 @@ class Overlay(QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.critical(f"Critical load error: {e}", exc_info=True)
     
+    async def loadWidgets(self):
+        for type_name, loader_cls in PreLoader.instances.items():
+            group_name = f"{type_name}s"
+            for target, item in loader_cls.load_group(group_name, self.settings, self, self.progressive):
+                with span("update_status", plugin=item.save_name):
+                    await self.update_status("screen.load_plugin", plugin_name=item.save_name)
+                if target:
+                    self.setWidgetMemory(item.save_name, target)
+                if item:
+                    self.listPlugins.addItem(item)
+                    if item.pending:
+                        self._deferred.append(item)
+    
+    def startWatching(self):
+        watcher = watchAppFolders()
+        watcher.subscribe(ThemeController().onFilesChanged, kinds=["plugin"])
+    
+    def startDeferredActivation(self):
+        if not self._deferred:
+            return
+        # stable sort: equal priorities keep the saved order
+        self._deferred.sort(key=lambda item: item.priority, reverse=True)
+        self._deferred_total = len(self._deferred)
+        logger.info(f"Progressive activation of {self._deferred_total} plugins")
+        QTimer.singleShot(0, self._activateDeferredStep)
+    
+    def _activateDeferredStep(self):
+        """Builds pending plugins until the frame budget is spent (at least one per step)"""
+        deadline = time.perf_counter() + self.activation_budget
+        while self._deferred:
+            self._activateDeferred(self._deferred.pop(0))
+            if time.perf_counter() >= deadline:
+                break
+        
+        if self._deferred:
+            QTimer.singleShot(0, self._activateDeferredStep)
+        else:
+            logger.info("Progressive activation finished")
+    
+    def _activateDeferred(self, item: PluginItem):
+        try:
+            # the user may have toggled the item while it was waiting
+            if item.active and item.widget is None:
+                with span(f"activate:{item.save_name}", category="plugin"):
+                    target = PreLoader.instances[item.module_type.lower()].activate(item, self)
+                if target is not None:
+                    self.setWidgetMemory(item.save_name, target)
+        except Exception as e:
+            logger.error(f"Failed to activate '{item.save_name}': {e}", exc_info=True)
+        finally:
+            item.pending = False
+            self.listPlugins.refreshItem(item)
+            done = self._deferred_total - len(self._deferred)
+            logger.debug(f"Activated {done}/{self._deferred_total}: {item.save_name}")
+    
     def _handler_settings_websocket(self, state: bool):
         if state:
             self.active_web_sockets()
@@ -315,9 +395,11 @@ class Overlay(QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.error(f"Failed to deactivate WebSockets: {e}", exc_info=True)
     
+    @traced("Overlay.loadTheme")
     def loadTheme(self):
         try:
-            self.interface["ThemeCLI"] = ThemeCLI(self.themeLoader)
+            if "ThemeCLI" not in self.interface:
+                self.interface["ThemeCLI"] = ThemeCLI(self.themeLoader)
             theme_name = self.settings.value("theme")
             if theme_name is None:
                 return
@@ -331,18 +413,20 @@ class Overlay(QMainWindow, Ui_MainWindow):
     def saveConfigs(self):
         try:
             logger.info("Saving application configuration...")
-            PreLoader.clear(self.settings)
-            
-            for item in self.listPlugins.items():
-                if item.module_type.lower() not in ["window", "widget"]:
-                    continue
-                PreLoader.save(item, self.settings)
+            with self.settingsWriter.edit():
+                PreLoader.clear(self.settings)
+                
+                for item in self.listPlugins.items():
+                    if item.module_type.lower() not in ["window", "widget"]:
+                        continue
+                    PreLoader.save(item, self.settings)
+                
+                self.settingWidget.save_setting(self.settings)
+                self.settings.setValue("theme", ThemeController().themeName())
+                self.settings.setValue("language", OverlayApplication.get_current_lang())
             
             PreLoader.saveConfigs()
-            self.settingWidget.save_setting(self.settings)
-            self.settings.setValue("theme", ThemeController().themeName())
-            self.settings.setValue("language", OverlayApplication.get_current_lang())
-            self.settings.sync()
+            self.settingsWriter.flush()
             logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}", exc_info=True)
@@ -370,14 +454,13 @@ class Overlay(QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.error(f"Failed to initialize System Tray: {e}", exc_info=True)
     
+    @traced("Overlay.updateDataPlugins")
     async def updateDataPlugins(self):
-        await asyncio.sleep(0.05)
         logger.info("Importing plugins...")
-        for i, (plugin_name, module) in enumerate(self.pluginLoader.plugins.items()):
+        for plugin_name, module in self.pluginLoader.plugins.items():
             self._load_single_plugin(plugin_name, module)
-            if i % 5 == 0:
-                QCoreApplication.processEvents()
-                await asyncio.sleep(0)
+            self._frame_pacer.tick()
+            await asyncio.sleep(0)
     
     def _load_single_plugin(self, plugin_name, module):
         try:
@@ -421,8 +504,8 @@ class Overlay(QMainWindow, Ui_MainWindow):
                 PreLoader.loadConfigInItem(item)
             
             if item.plugin_name:
-                PreLoader.save(item, self.settings)
-                self.settings.sync()
+                with self.settingsWriter.edit(item.save_name):
+                    PreLoader.save(item, self.settings)
         
         except Exception as e:
             logger.error(f"Failed to update state for item '{item.save_name}': {e}", exc_info=True)
@@ -486,8 +569,9 @@ class Overlay(QMainWindow, Ui_MainWindow):
     def updateConfigsPlugins(self):
         try:
             if self.dialogSettings:
-                PreLoader.configs.setValue(self.dialogSettings.save_name, self.dialogSettings.obj.save_status())
-                PreLoader.saveConfigs()
+                name = self.dialogSettings.save_name
+                with PreLoader.configsWriter().edit(name):
+                    PreLoader.configs.setValue(name, self.dialogSettings.obj.save_status())
         except Exception as e:
             logger.error(f"Failed to update plugin configs: {e}", exc_info=True)
     
@@ -531,6 +615,24 @@ class Overlay(QMainWindow, Ui_MainWindow):
             logger.error(f"WebSocket shortcut error: {e}", exc_info=True)
             self.webSocketIn.sendErrorState(uid, e)
     
+    def handler_instance_message(self, message: str):
+        """Intent forwarded by another launch of overlay.py (see core.service.single_instance)"""
+        try:
+            match message.strip().split(" "):
+                case ["show"]:
+                    self.showOverlay()
+                case ["action", name]:
+                    self.handled_shortcut(name)
+                case ["cli", name_int, *args]:
+                    if name_int not in self.interface:
+                        raise NameError(f"Interface not found: {name_int}")
+                    result = self.interface[name_int].runner(args)
+                    logger.info(f"CLI '{name_int}' from launch: {result}")
+                case _:
+                    logger.warning(f"Unknown launch intent: '{message}'")
+        except Exception as e:
+            logger.error(f"Launch intent error '{message}': {e}", exc_info=True)
+    
     def event(self, event):
         if event == QEvent.Type.ShortcutOverride:
             # Removed direct print, using debug level only if needed
@@ -575,7 +677,7 @@ class Overlay(QMainWindow, Ui_MainWindow):
             logger.info("Stopping overlay services...")
             self.webSocketIn.quit()
             self.saveConfigs()
-            self.settings.sync()
+            flushAll()
         except Exception as e:
             logger.error(f"Error stopping overlay: {e}", exc_info=True)
     
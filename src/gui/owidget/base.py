@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Optional
 from PySide6.QtCore import Qt, QTimer
 
 from core.common import APIBaseWidget
-from core.config import Config
+from core.config import Config, ConfigDiff
 from plugins.flags_installer import FlagsInstaller
 from plugins.preloaders import WidgetPreLoader
 from gui.themes import ThemeController
@@ -86,11 +86,18 @@ class OWidget(APIBaseWidget, ABC):
     def reload_config(self):
         logger.info(f"Reloading config for widget: {self.config.name}")
         try:
-            self.config.reload()
-            self.load_config()
+            self.apply_config(self.config.reload())
         except Exception as e:
             logger.error(f"Failed to reload config for {self.config.name}: {e}", exc_info=True)
     
+    def apply_config(self, diff: ConfigDiff):
+        """
+        Applies only the sections of the config changed by a reload.
+        A plugin that overrides ``load_config`` reads its own fields there, so it is called on any change.
+        """
+        if diff.changed("settings.style_file") or (diff and type(self).load_config is not OWidget.load_config):
+            self.load_config()
+    
     def save_status(self) -> LDT:
         ldt = LDT()
         ldt.set("position", self.pos())
@@ -9,7 +9,7 @@ from PySide6.QtWidgets import QGraphicsColorizeEffect, QWidget, QVBoxLayout
 from PySide6.QtCore import Qt, QPoint, QTimer
 
 from core.common import APIBaseWidget
-from core.config import Config
+from core.config import Config, ConfigDiff
 from plugins.flags_installer import FlagsInstaller
 from plugins.preloaders import WindowPreLoader
 from gui.utils import clampAllDesktopP
@@ -105,12 +105,34 @@ class OWindow(APIBaseWidget, ABC):
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}", exc_info=True)
     
+    def apply_config(self, diff: ConfigDiff):
+        """
+        Applies only the sections of the config changed by a reload.
+        A plugin that overrides ``load_config`` reads its own fields there, so it is called instead.
+        """
+        try:
+            if diff and type(self).load_config is not OWindow.load_config:
+                self.load_config()
+                return
+            
+            settings = self.config.data.settings
+            if diff.changed("settings.window.width", "settings.window.height"):
+                self.setFixedSize(settings.window.width, settings.window.height)
+            
+            if diff.changed("settings.style_file"):
+                ThemeController().register(self, f"plugin://{self.config.name}/{settings.style_file}", False)
+                ThemeController().updateUid(self.uid)
+            
+            if diff.changed("settings.window.opacity"):
+                self.setWindowOpacity(settings.window.opacity)
+        except Exception as e:
+            logger.error(f"Failed to apply configuration changes: {e}", exc_info=True)
+    
     def reload_config(self):
         try:
             logger.info("Reloading configuration...")
             self.reloading = True
-            self.config.reload()
-            self.load_config()
+            self.apply_config(self.config.reload())
             self.process()
         except Exception as e:
             logger.error(f"Failed to reload configuration: {e}", exc_info=True)
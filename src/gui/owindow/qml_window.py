@@ -144,8 +144,8 @@ class OQMLWindow(OWindow):
     
     def reload_config(self):
         try:
+            # context properties are theme colors, they are updated on ApplicationPaletteChange
             logger.info("Reloading QML Window configuration")
-            self.loadPresetData()
             super().reload_config()
         except Exception as e:
             logger.error(f"Failed to reload config: {e}", exc_info=True)
\ No newline at end of file
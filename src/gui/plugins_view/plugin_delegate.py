@@ -90,6 +90,7 @@ class PluginDelegate(QStyledItemDelegate):
             typePlugin = index.data(PluginItemRole.TYPE_ROLE)
             active = index.data(PluginItemRole.ACTIVE_ROLE)
             isClone = index.data(PluginItemRole.IS_DUPLICATE)
+            pending = index.data(PluginItemRole.PENDING)
             
             # 1. Background and Border
             rect = option.rect.adjusted(2, 2, -2, -2)
@@ -132,6 +133,8 @@ class PluginDelegate(QStyledItemDelegate):
                                  f"ID: {idClone} (Clone)")
             
             type_rect = option.rect.adjusted(0, 0, -15, -8)
+            if pending:
+                typePlugin = f"{typePlugin} · loading..."
             painter.drawText(type_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, typePlugin)
         except Exception as e:
             logger.error(f"Error in paintNormalItem: {e}", exc_info=True)
@@ -75,6 +75,12 @@ class PluginList(QListView):
         except Exception as e:
             logger.error(f"Failed to remove item: {e}", exc_info=True)
     
+    def refreshItem(self, item: PluginItem):
+        try:
+            self.model_data.refreshItem(item)
+        except Exception as e:
+            logger.error(f"Failed to refresh item: {e}", exc_info=True)
+    
     def items(self) -> List[PluginItem]:
         try:
             return self.model_data.items()
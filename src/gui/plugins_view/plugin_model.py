@@ -103,6 +103,9 @@ class PluginDataModel(QAbstractListModel):
             elif role == PluginItemRole.ACTIVE_ROLE:
                 return getattr(item, 'active', False)
             
+            elif role == PluginItemRole.PENDING:
+                return getattr(item, 'pending', False)
+            
             elif role == PluginItemRole.ICON:
                 return item.icon
             
@@ -117,6 +120,8 @@ class PluginDataModel(QAbstractListModel):
                     # Return tuple (Text, Color)
                     return item.getErrorStr(), "#ffe0e0"
                 
+                if getattr(item, 'pending', False):
+                    return "Activating...", "#ffd54f"
                 if getattr(item, 'widget', None) is not None:
                     return "Working correctly", "#26fc75"
                 else:
@@ -183,5 +188,11 @@ class PluginDataModel(QAbstractListModel):
         except Exception as e:
             logger.error(f"Failed to update item state: {e}", exc_info=True)
     
+    def refreshItem(self, item: PluginBase):
+        """Repaints the row of the item (activation progress, state)"""
+        idx = self.findIndexItem(item)
+        if idx.isValid():
+            self.dataChanged.emit(idx, idx)
+    
     def items(self) -> List[Union[PluginItem, PluginBadItem]]:
         return self._plugins[:]
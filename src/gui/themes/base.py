@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from PySide6.QtGui import QColor, QFont, QFontDatabase, QIcon, QPixmap, QImage
 from attrs import define, field
 
+from utils.fs import overlay_buffer
 from .colorize import modulateIcon, modulateImage, modulatePixmap
 
 # Initialize logger for this module
@@ -107,10 +108,9 @@ class Theme(ABC):
         try:
             modulate = self.modulateImage()
             
-            # Using context manager for safe file reading
+            # Stored archive members are read from the mapped archive; Qt takes bytes only
             try:
-                with open(path, "rb") as f:
-                    data = f.read()
+                data = bytes(overlay_buffer(path))
             except FileNotFoundError:
                 logger.error(f"Image file not found: {path}", exc_info=True)
                 return None
@@ -3,18 +3,20 @@ import logging
 from typing import Optional, Dict
 import uuid
 import re
-import toml
 
 from PySide6.QtCore import QEvent, QCoreApplication, QObject, QDir
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication, QWidget
-from jinja2 import Environment, Template, ChoiceLoader
+from jinja2 import Environment, Template
 from attrs import define, field
 from fs import open_fs
 from fs.subfs import SubFS
 from fs import errors, path as fs_path
 
-from utils.fs import FSLoader, getAppPath
+from utils import codecs
+from utils.fs import FSLoader, getAppPath, read_many
+from utils.fs.jloader import ChoiceFSLoader, TemplateBytecodeCache
+from core.service.tracer import traced
 from .base import Theme
 
 # Initialize logger for this module
@@ -56,7 +58,7 @@ class ResourceBuilder:
     def builder(self, mainColor: QColor, altColor: QColor):
         try:
             data_file = self._cache.readtext("theme_cache.toml")
-            data = toml.loads(data_file)
+            data = codecs.loads("toml", data_file)
             
             cached_main = data.get("main_color")
             cached_alt = data.get("alt_color")
@@ -84,7 +86,7 @@ class ResourceBuilder:
                 "main_color": mainColor.name(QColor.NameFormat.HexRgb),
                 "alt_color": altColor.name(QColor.NameFormat.HexRgb)
             }
-            self._cache.writetext("theme_cache.toml", toml.dumps(data))
+            self._cache.writetext("theme_cache.toml", codecs.dumps("toml", data))
             
             # Retrieve icons from the current theme (singleton usage implied by original logic)
             theme_controller = ThemeController()
@@ -95,12 +97,25 @@ class ResourceBuilder:
             icons = theme_controller.currentTheme.getIconTheme
             context = [("main", mainColor)]
             
+            # One pass per folder (archive) instead of an open per icon
+            folders: Dict[str, list[str]] = {}
+            for path_icon in icons:
+                folder, nameFile = fs_path.split(path_icon)
+                folders.setdefault(folder, []).append(nameFile)
+            
+            contents = {}
+            for folder, names in folders.items():
+                try:
+                    for nameFile, data in read_many(folder, names).items():
+                        contents[f"{folder}/{nameFile}"] = data
+                except Exception as e:
+                    logger.error(f"Failed to read icons from '{folder}': {e}", exc_info=True)
+            
             for folder_name, color in context:
                 self._cache.makedir(folder_name, recreate=True)
                 for path_icon in icons:
                     try:
-                        with open(path_icon, "r", encoding="utf-8") as f:
-                            content = f.read()
+                        content = bytes(contents[path_icon]).decode("utf-8")
                         
                         nameFile = fs_path.basename(path_icon)
                         content_file = self._replaceColors(content, color, altColor)
@@ -201,11 +216,11 @@ class ThemeController(metaclass=MetaSingtools):
         try:
             logger.debug("Initializing ThemeController...")
             
-            self.loader = ChoiceLoader([
+            self.loader = ChoiceFSLoader([
                 FSLoader("qt://root/css"),
                 FSLoader("plugin://")
             ])
-            self.env = Environment(loader=self.loader)
+            self.env = Environment(loader=self.loader, bytecode_cache=TemplateBytecodeCache())
             self.resource_builder = ResourceBuilder("#ff0000", "#00ff00")
             
             # Register Jinja filters
@@ -297,6 +312,20 @@ class ThemeController(metaclass=MetaSingtools):
         except Exception as e:
             logger.error(f"Failed to update images: {e}", exc_info=True)
     
+    def onFilesChanged(self, events):
+        """Plugin archives changed on disk: only their templates are reloaded and re-rendered"""
+        try:
+            names = {event.name for event in events}
+            for name in names:
+                self.loader.invalidate(name)
+            
+            for uid, int_style in self.interface.items():
+                if int_style.env_path and fs_path.iteratepath(int_style.env_path)[0] in names:
+                    int_style.template = None
+                    self.updateUid(uid)
+        except Exception as e:
+            logger.error(f"Failed to reload templates: {e}", exc_info=True)
+    
     def updateAll(self):
         try:
             logger.info("Updating all theme components...")
@@ -366,6 +395,7 @@ class ThemeController(metaclass=MetaSingtools):
             logger.error(f"Modulation failed: {e}", exc_info=True)
             return None
     
+    @traced("ThemeController.setTheme")
     def setTheme(self, theme: Theme):
         try:
             logger.info(f"Setting theme: {theme.themeName}")
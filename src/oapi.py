@@ -1,21 +1,60 @@
-# API для создания своих плагинов (окна и виджеты)
-from gui.owidget import OWidget, PluginSettingWidget, ModeRuns
-from gui.owindow import OWindow, PluginSettingWindow, OQMLWindow
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# API для получения темы и создание своей
-from gui.themes import ThemeController, Theme
-from gui.themes import modulatePixmap, modulateImage, modulateIcon
+if TYPE_CHECKING:
+    from gui.owidget import OWidget, PluginSettingWidget, ModeRuns
+    from gui.owindow import OWindow, PluginSettingWindow, OQMLWindow
+    from gui.themes import ThemeController, Theme
+    from gui.themes import modulatePixmap, modulateImage, modulateIcon
+    from core.common import BaseHotkeyHandler
+    from core.config import Config, ConfigDiff
+    from core.cli import CLInterface, MetaCliInterface
+    from core import default_configs
+    from plugins.flags_installer import FlagsInstaller
+    from utils.system import open_file_manager, getSystem
+    from utils.fs import overlay_open, read_many, aopen, aread, awrite
+    from utils.input import EmitterFakeInput, BaseCommonKey, BaseLinuxKey, BaseWindowsKey
 
-# Обще доступные API
-from core.common import BaseHotkeyHandler
-from core.config import Config
-from core.cli import CLInterface, MetaCliInterface
-from core import default_configs
-
-from plugins.flags_installer import FlagsInstaller
-
-from utils.system import open_file_manager, getSystem
-from utils.input import EmitterFakeInput, BaseCommonKey, BaseLinuxKey, BaseWindowsKey
+# Имена резолвятся при первом обращении (PEP 562): плагину с OWidget
+# не нужно импортировать эмуляцию ввода, аудио и CLI.
+_exports = {
+    # API для создания своих плагинов (окна и виджеты)
+    "OWidget": "gui.owidget",
+    "PluginSettingWidget": "gui.owidget",
+    "ModeRuns": "gui.owidget",
+    "OWindow": "gui.owindow",
+    "PluginSettingWindow": "gui.owindow",
+    "OQMLWindow": "gui.owindow",
+    
+    # API для получения темы и создание своей
+    "ThemeController": "gui.themes",
+    "Theme": "gui.themes",
+    "modulatePixmap": "gui.themes",
+    "modulateImage": "gui.themes",
+    "modulateIcon": "gui.themes",
+    
+    # Обще доступные API
+    "BaseHotkeyHandler": "core.common",
+    "Config": "core.config",
+    "ConfigDiff": "core.config",
+    "CLInterface": "core.cli",
+    "MetaCliInterface": "core.cli",
+    "default_configs": "core",
+    
+    "FlagsInstaller": "plugins.flags_installer",
+    
+    "open_file_manager": "utils.system",
+    "getSystem": "utils.system",
+    "overlay_open": "utils.fs",
+    "read_many": "utils.fs",
+    "aopen": "utils.fs",
+    "aread": "utils.fs",
+    "awrite": "utils.fs",
+    "EmitterFakeInput": "utils.input",
+    "BaseCommonKey": "utils.input",
+    "BaseLinuxKey": "utils.input",
+    "BaseWindowsKey": "utils.input",
+}
 
 __all__ = [
     "OWidget", "PluginSettingWidget", "ModeRuns",
@@ -24,6 +63,27 @@ __all__ = [
     "Theme", "ThemeController", "modulateImage", "modulateIcon", "modulatePixmap",
     
     "BaseHotkeyHandler", "BaseLinuxKey", "BaseWindowsKey", "BaseCommonKey", "EmitterFakeInput",
-    "CLInterface", "MetaCliInterface", "Config", "default_configs",
-    "getSystem", "open_file_manager"
+    "CLInterface", "MetaCliInterface", "Config", "ConfigDiff", "default_configs",
+    "getSystem", "open_file_manager", "overlay_open", "read_many",
+    "aopen", "aread", "awrite"
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = import_module(module_name)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        # submodule that is not imported by its package yet (core.default_configs)
+        value = import_module(f"{module_name}.{name}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
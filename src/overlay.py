@@ -4,6 +4,18 @@ import builtins
 import warnings
 import asyncio
 
+from core.service.single_instance import forwardToRunning, SingleInstance
+
+# a second launch hands its intent to the running overlay before Qt is imported
+if __name__ == "__main__" and (exit_code := forwardToRunning(sys.argv)) is not None:
+    sys.exit(exit_code)
+
+from core.service.import_profiler import ImportProfiler
+
+# installed before the heavy imports so that they are attributed too
+if ImportProfiler().enabled:
+    ImportProfiler().install()
+
 import qasync
 
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated")
@@ -14,14 +26,18 @@ from PySide6.QtQuick import QQuickWindow, QSGRendererInterface
 from qasync import QEventLoop
 
 from core.service.print_manager import PrintManager
+from core.service.tracer import BootTracer
 from core.metadata import metadata, version
 from core.main_init import OpenManager
 from core.application import OverlayApplication
 from gui.themes import ThemeController, DefaultTheme
 from gui.splash_screen import GifSplashScreen
-from utils.fs import ToolsIniter, getAppPath
-# noinspection PyUnresolvedReferences
-import assets_rc
+from utils.fs import ToolsIniter, getAppPath, registerResources
+from utils.fs.aio import shutdownIo
+from core.service.write_behind import flushAll
+
+registerResources()
+
 # noinspection PyUnresolvedReferences
 import core.importers
 # noinspection PyUnresolvedReferences
@@ -29,6 +45,9 @@ import core.logger
 
 
 async def main():
+    tracer = BootTracer()
+    tracer.begin("overlay.main")
+    
     if sys.platform == "linux":
         os.environ["QT_QPA_PLATFORM"] = "xcb"
     
@@ -63,19 +82,25 @@ async def main():
             try:
                 builtins.windowOverlay = window
                 splash.finish(window)
+                tracer.end("overlay.main")
+                tracer.dump()
+                ImportProfiler().finish()
+                # intents of later launches (and of this one) arrive once loading is done
+                SingleInstance().setHandler(window.instance_message.emit)
             except Exception as e:
                 qFatal(f"Error on finalize: {e}")
                 app.exit()
         
         window.finished_loading.connect(on_finalized)
-        await asyncio.sleep(1)
         await window.ready()
         
         try:
             with loop:
                 loop.run_forever()
         finally:
-            pass
+            # let queued plugin and settings writes reach the disk
+            flushAll()
+            shutdownIo()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,13 @@ import os
 import sys
 from functools import cache
 from pathlib import Path
+from typing import Optional
 import json5
 
 import typer
 import click
 from rich.console import Console
+from rich.table import Table
 
 import warnings
 
@@ -76,5 +78,56 @@ def action_cli_interface():
         raise typer.Exit(code=1225)
 
 
+@app.command(name="imports", help="Профиль времени импорта модулей Overlay (как -X importtime)")
+def action_imports(
+        top: int = typer.Option(20, help="Сколько самых медленных модулей показать"),
+        plugins: bool = typer.Option(True, help="Импортировать плагины из plugins/"),
+        output: Optional[Path] = typer.Option(None, help="Сохранить отчёт в JSON"),
+):
+    from core.service.import_profiler import ImportProfiler
+    
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        # тот же порядок, что и при запуске overlay.py
+        import core.main_init
+        import core.importers
+        from utils.fs import ToolsIniter
+        ToolsIniter("tools").load()
+        import gui.main_window
+        if plugins:
+            from core.loaders import PluginLoader
+            PluginLoader().load()
+    finally:
+        profiler.uninstall()
+    
+    report = profiler.report(top)
+    console.print(
+        f"[bold]{report['modules']}[/bold] модулей, [bold]{report['total_ms']:.1f}[/bold] ms, "
+        f"просмотрено записей sys.path: [bold]{report['scanned']}[/bold]"
+    )
+    
+    groups = Table("Источник", "Модулей", "ms", title="По источникам")
+    for name, group in report["groups"].items():
+        groups.add_row(name, str(group["modules"]), f"{group['self_ms']:.1f}")
+    console.print(groups)
+    
+    offenders = Table("Модуль", "Источник", "self ms", "cumul. ms", "sys.path", title=f"Топ {top}")
+    for record in report["top"]:
+        offenders.add_row(
+            record["name"], record["group"], f"{record['self_ms']:.1f}", f"{record['cumulative_ms']:.1f}",
+            str(record["scanned"]),
+        )
+    console.print(offenders)
+    
+    paths = Table("#", "Запись sys.path", "Промахов", title="sys.path")
+    for index, item in enumerate(report["sys_path"]):
+        paths.add_row(str(index), item["entry"] or "''", str(item["misses"]))
+    console.print(paths)
+    
+    if output is not None:
+        profiler.dump(output, top)
+
+
 if __name__ == '__main__':
     app(help_option_names=["--help", "-h"])
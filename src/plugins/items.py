@@ -27,6 +27,7 @@ class PluginItemRole(IntEnum):
     IS_DUPLICATE = auto()
     IS_BAD = auto()
     ERROR = auto()
+    PENDING = auto()
 
 
 @define(slots=False, kw_only=True)
@@ -57,6 +58,10 @@ class PluginItem(PluginBase):
     is_duplicate: bool = field(init=False, default=False, repr=False)
     widget: Optional[APIBaseWidget] = field(init=False, default=None, repr=False)
     
+    # Progressive activation: higher priority is built first, pending until then
+    priority: int = field(init=False, default=0, repr=False)
+    pending: bool = field(init=False, default=False, repr=False)
+    
     def __attrs_post_init__(self):
         try:
             self.plugin_name = self.module.__name__
@@ -1,6 +1,8 @@
+import sys
 import logging
 import importlib
 from types import ModuleType
+from typing import Optional
 from abc import ABC, abstractmethod, ABCMeta
 
 from PySide6.QtWidgets import QMenu
@@ -10,6 +12,8 @@ from ldt.io_drives.drivers.extra import Json5Driver
 from core.common import APIBaseWidget
 from utils.fs import getAppPath
 from plugins.items import PluginItem
+from core.service.tracer import traced, span
+from core.service.write_behind import WriteBehind
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
@@ -27,8 +31,17 @@ class MetaSingToolsPreloader(ABCMeta):
 class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
     instances = {}
     configs = NexusStore(getAppPath() / "configs" / "configs_plugins.json5", Json5Driver(), preload=False)
+    _configs_writer: Optional[WriteBehind] = None
     
     @classmethod
+    def configsWriter(cls) -> WriteBehind:
+        """Debounced background writes of configs_plugins.json5 (created with the first change)"""
+        if cls._configs_writer is None:
+            cls._configs_writer = WriteBehind(cls.configs, "configs_plugins.json5")
+        return cls._configs_writer
+    
+    @classmethod
+    @traced("PreLoader.loadConfigs")
     def loadConfigs(cls):
         cls.configs.clear()
         try:
@@ -39,7 +52,7 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
             cls.configs.sync()
     
     @classmethod
-    def load_group(cls, group_name: str, settings: NexusStore, parent):
+    def load_group(cls, group_name: str, settings: NexusStore, parent, defer: bool = False):
         try:
             with settings.group_context(group_name):
                 child_groups = settings.childGroups()
@@ -53,7 +66,8 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
                             logger.debug(f"Removing existing instance of '{item_name}' before reload")
                             parent.listPlugins.remove(old_item)
                         
-                        target, item = cls.loaded(settings, item_name, parent)
+                        with span(f"load_group:{item_name}", group=group_name):
+                            target, item = cls.loaded(settings, item_name, parent, defer)
                         yield target, item
                     
                     except ModuleNotFoundError:
@@ -67,7 +81,7 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
     @classmethod
     def saveConfigs(cls):
         try:
-            cls.configs.sync()
+            cls.configsWriter().flush()
             logger.debug("Plugin configurations synced to disk")
         except Exception as e:
             logger.error(f"Failed to save configs: {e}", exc_info=True)
@@ -77,25 +91,29 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
         try:
             with setting.group_context(item.save_name):
                 if target is not None:
-                    cls.configs.setValue(item.save_name, target.save_status())
+                    with cls.configsWriter().edit(item.save_name):
+                        cls.configs.setValue(item.save_name, target.save_status())
                 
                 setting.setValue("module", item.module.__name__)
                 setting.setValue("active", item.active)
                 setting.setValue("orig_name", item.plugin_name)
+                setting.setValue("priority", item.priority)
                 
                 cls.overSaved(item, setting)
         except Exception as e:
             logger.error(f"Failed to save state for plugin '{item.save_name}': {e}", exc_info=True)
     
     @classmethod
-    def loaded(cls, setting: NexusStore, name: str, parent):
+    def loaded(cls, setting: NexusStore, name: str, parent, defer: bool = False):
+        """With ``defer`` an active item is only marked pending, ``activate`` builds it later."""
         try:
             with setting.group_context(name):
                 active = setting.value("active", False)
                 module_name = setting.value("module")
                 
                 logger.debug(f"Importing module: {module_name}")
-                module = importlib.import_module(module_name)
+                # deferred plugins are taken as registered, import_module is for the rest
+                module = sys.modules.get(module_name) or importlib.import_module(module_name)
                 
                 origname = setting.value("orig_name", name.rsplit("_", 1)[0])
                 
@@ -107,13 +125,14 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
                 
                 item = cls.overCreateItem(*parameters)
                 item.plugin_name = origname
+                item.priority = setting.value("priority", 0)
                 
                 target = cls.overLoaded(setting, name, parent)
                 
-                if active:
-                    target = item.build(parent)
-                    cls.loadConfigInItem(item)
-                    cls.activatedWidget(active, target)
+                if active and defer:
+                    item.pending = True
+                elif active:
+                    target = cls.activate(item, parent)
             
             return target, item
         
@@ -124,6 +143,14 @@ class PreLoader(ABC, metaclass=MetaSingToolsPreloader):
             logger.error(f"Error loading plugin '{name}': {e}", exc_info=True)
             raise e
     
+    @classmethod
+    def activate(cls, item: PluginItem, parent):
+        target = item.build(parent)
+        cls.loadConfigInItem(item)
+        cls.activatedWidget(True, target)
+        item.pending = False
+        return target
+    
     @classmethod
     def loadConfigInItem(cls, item: PluginItem):
         try:
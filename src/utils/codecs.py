@@ -0,0 +1,152 @@
+"""
+Readers and writers of config formats. Each format has interchangeable backends:
+reads go through the fastest available one, writes through one that can produce the format.
+The backend of a format is picked with ``setCodec`` or ``OVERLAY_CODEC_<FORMAT>=<backend>``.
+"""
+import os
+import json
+import logging
+import tomllib
+from typing import Any, Callable, Optional, Union
+
+import toml
+
+logger = logging.getLogger(__name__)
+
+Data = Union[str, bytes, bytearray, memoryview]
+
+
+def _text(data: Data) -> str:
+    return data if isinstance(data, str) else bytes(data).decode("utf-8")
+
+
+class Codec:
+    """Backend of one format: ``loads`` parses text or bytes, ``dumps`` serializes a dict"""
+    
+    def __init__(self, name: str, loads: Callable[[str], Any], dumps: Optional[Callable[[Any], str]] = None):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+    
+    @property
+    def writable(self) -> bool:
+        return self._dumps is not None
+    
+    def loads(self, data: Data) -> Any:
+        return self._loads(_text(data))
+    
+    def dumps(self, data: Any) -> str:
+        if self._dumps is None:
+            raise NotImplementedError(f"Codec '{self.name}' can only read")
+        return self._dumps(data)
+    
+    def load(self, file) -> Any:
+        return self.loads(file.read())
+    
+    def dump(self, data: Any, file):
+        file.write(self.dumps(data))
+    
+    def __repr__(self):
+        return f"<Codec {self.name}>"
+
+
+# format -> backend name -> codec
+_codecs: dict[str, dict[str, Codec]] = {}
+# format -> selected backend name
+_selected: dict[str, str] = {}
+
+
+def registerCodec(fmt: str, codec: Codec, default: bool = False):
+    _codecs.setdefault(fmt, {})[codec.name] = codec
+    if default or fmt not in _selected:
+        _selected[fmt] = codec.name
+
+
+def setCodec(fmt: str, name: str):
+    if name not in _codecs.get(fmt, {}):
+        raise KeyError(f"Unknown codec '{name}' for {fmt}, available: {available(fmt)}")
+    _selected[fmt] = name
+    logger.info(f"Codec for {fmt}: {name}")
+
+
+def trySetCodec(fmt: str, name: str) -> bool:
+    """``setCodec`` for user settings: an unknown backend keeps the current one with a warning"""
+    try:
+        setCodec(fmt, name)
+    except KeyError as e:
+        logger.warning(f"{e.args[0]}, keeping {_selected.get(fmt)}")
+        return False
+    return True
+
+
+def formats() -> list[str]:
+    return sorted(_codecs)
+
+
+def available(fmt: str) -> list[str]:
+    return sorted(_codecs.get(fmt, {}))
+
+
+def codec(fmt: str, name: Optional[str] = None) -> Codec:
+    """Backend ``name`` of a format, the selected one by default"""
+    return _codecs[fmt][name or _selected[fmt]]
+
+
+def writer(fmt: str) -> Codec:
+    """Selected backend if it can write, otherwise the first one that can"""
+    selected = codec(fmt)
+    if selected.writable:
+        return selected
+    return next(item for item in _codecs[fmt].values() if item.writable)
+
+
+def loads(fmt: str, data: Data) -> Any:
+    return codec(fmt).loads(data)
+
+
+def dumps(fmt: str, data: Any) -> str:
+    return writer(fmt).dumps(data)
+
+
+def _tomllibLoads(text: str) -> Any:
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        # files written for the toml package may use syntax TOML 1.0 rejects
+        try:
+            data = toml.loads(text)
+        except toml.TomlDecodeError:
+            raise e from None
+        logger.warning(f"Config is not valid TOML 1.0 ({e}), read with the toml package; "
+                       f"this fallback is deprecated and will be removed, please fix the file")
+        return data
+
+
+registerCodec("toml", Codec("toml", toml.loads, toml.dumps))
+# stdlib parser: faster than toml, but read only
+registerCodec("toml", Codec("tomllib", _tomllibLoads), default=True)
+registerCodec("json", Codec("json", json.loads, lambda data: json.dumps(data, ensure_ascii=False, indent=4)))
+
+try:
+    import json5
+except ImportError:
+    pass
+else:
+    registerCodec("json5", Codec("json5", json5.loads, lambda data: json5.dumps(data, ensure_ascii=False, indent=4)))
+
+try:
+    import yaml
+except ImportError:
+    pass
+else:
+    registerCodec("yaml", Codec("yaml", lambda text: yaml.load(text, yaml.SafeLoader), yaml.safe_dump))
+    if hasattr(yaml, "CSafeLoader"):
+        registerCodec("yaml", Codec(
+            "libyaml", lambda text: yaml.load(text, yaml.CSafeLoader),
+            lambda data: yaml.dump(data, Dumper=yaml.CSafeDumper),
+        ), default=True)
+
+for _fmt in list(_codecs):
+    _name = os.environ.get(f"OVERLAY_CODEC_{_fmt.upper()}")
+    if _name:
+        trySetCodec(_fmt, _name)
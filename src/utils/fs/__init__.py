@@ -1,8 +1,13 @@
 from .jloader import FSLoader
 from .bootstrap import getAppPath, getAssetsPath, ToolsIniter
 from .io_manager import OpenManager
+from .url_resolver import UrlResolver, overlay_open, overlay_buffer, read_many
+from .aio import aopen, aread, awrite, AsyncFile
+from .resources import registerResources, getResourceBundle
 
 from .fs_qt import *
 from .fs_impl import *
 
-__all__ = ["FSLoader", "ToolsIniter", "getAssetsPath", "getAppPath", "OpenManager"]
+__all__ = ["FSLoader", "ToolsIniter", "getAssetsPath", "getAppPath", "OpenManager", "UrlResolver", "overlay_open",
+           "overlay_buffer", "read_many", "aopen", "aread", "awrite", "AsyncFile",
+           "registerResources", "getResourceBundle"]
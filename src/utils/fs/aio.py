@@ -0,0 +1,124 @@
+import asyncio
+import contextvars
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from .url_resolver import overlay_open
+
+logger = logging.getLogger(__name__)
+
+IO_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def ioExecutor() -> ThreadPoolExecutor:
+    """Bounded pool for file operations, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="fs-io")
+        return _executor
+
+
+def shutdownIo(wait: bool = True):
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def _run(func: Callable, *args, **kwargs) -> Any:
+    # run_in_executor does not carry contextvars: _current_plugin is needed for plugin:// and pldata://
+    ctx = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ioExecutor(), partial(ctx.run, func, *args, **kwargs))
+
+
+class AsyncFile:
+    """
+    File opened with ``overlay_open`` on the I/O pool; every call is awaited there.
+    Usable as ``f = await aopen(...)`` and as ``async with aopen(...) as f``.
+    """
+    
+    def __init__(self, file, mode="r", *args, **kwargs):
+        self.name = file
+        self.mode = mode
+        self._open_args = (args, kwargs)
+        self._file = None
+    
+    async def _open(self) -> "AsyncFile":
+        if self._file is None:
+            args, kwargs = self._open_args
+            self._file = await _run(overlay_open, self.name, self.mode, *args, **kwargs)
+        return self
+    
+    def __await__(self):
+        return self._open().__await__()
+    
+    async def __aenter__(self) -> "AsyncFile":
+        return await self._open()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self._file is None or self._file.closed
+    
+    async def read(self, size: int = -1):
+        return await _run(self._file.read, size)
+    
+    async def readline(self, size: int = -1):
+        return await _run(self._file.readline, size)
+    
+    async def readlines(self) -> list:
+        return await _run(self._file.readlines)
+    
+    async def write(self, data) -> int:
+        return await _run(self._file.write, data)
+    
+    async def seek(self, offset: int, whence: int = 0) -> int:
+        return await _run(self._file.seek, offset, whence)
+    
+    async def tell(self) -> int:
+        return await _run(self._file.tell)
+    
+    async def flush(self):
+        await _run(self._file.flush)
+    
+    async def close(self):
+        if self._file is not None and not self._file.closed:
+            await _run(self._file.close)
+
+
+def aopen(file, mode="r", *args, **kwargs) -> AsyncFile:
+    """Async ``open`` for paths and plugin://, pldata://, project:// and other fs urls"""
+    return AsyncFile(file, mode, *args, **kwargs)
+
+
+def _read(file, mode, kwargs):
+    with overlay_open(file, mode, **kwargs) as handle:
+        return handle.read()
+
+
+def _write(file, data, mode, kwargs):
+    with overlay_open(file, mode, **kwargs) as handle:
+        return handle.write(data)
+
+
+async def aread(file, mode: str = "r", **kwargs):
+    """Reads a whole file in one trip to the I/O pool"""
+    return await _run(_read, file, mode, kwargs)
+
+
+async def awrite(file, data, mode: Optional[str] = None, **kwargs) -> int:
+    """Writes a whole file in one trip to the I/O pool; mode defaults to "w" or "wb" by data type"""
+    if mode is None:
+        mode = "w" if isinstance(data, str) else "wb"
+    return await _run(_write, file, data, mode, kwargs)
@@ -1,14 +1,28 @@
+import io
+import os
+import mmap
+import struct
 import pathlib
+import zipfile
+import threading
+import logging
 from abc import abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Union
 import re
 
 from fs.base import FS
 from fs.opener import Opener
 from fs.opener.parse import ParseResult
-from fs import open_fs
+from fs import errors
 from fs.enums import ResourceType
+from fs.glob import match
 from fs.osfs import OSFS
+from fs.path import relpath, normpath
 from fs.wrap import WrapReadOnly
+from fs.zipfs import ReadZipFS
+
+logger = logging.getLogger(__name__)
 
 
 class MyWrapReadOnly(WrapReadOnly):
@@ -16,6 +30,397 @@ class MyWrapReadOnly(WrapReadOnly):
         return self._wrap_fs.opendir(path, factory)
 
 
+class BufferReader(io.RawIOBase):
+    """
+    Read-only file over a buffer (memoryview) that is never copied except into read() results.
+    ``valid`` is asked before each read; a buffer over a mapped file stops being read once it returns False.
+    """
+    
+    def __init__(self, data, name: str = "", valid: Optional[Callable[[], bool]] = None):
+        super().__init__()
+        self.name = name
+        self._view = memoryview(data).toreadonly()
+        self._pos = 0
+        self._valid = valid
+    
+    def _check(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self._valid is not None and not self._valid():
+            raise OSError(f"Файл изменился на диске: {self.name}")
+    
+    @property
+    def mode(self) -> str:
+        return "rb"
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def getbuffer(self) -> memoryview:
+        return self._view
+    
+    def readinto(self, buffer) -> int:
+        self._check()
+        chunk = self._view[self._pos:self._pos + len(buffer)]
+        size = len(chunk)
+        memoryview(buffer).cast("B")[:size] = chunk
+        self._pos += size
+        return size
+    
+    def read(self, size=-1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        self._check()
+        data = bytes(self._view[self._pos:self._pos + size])
+        self._pos += len(data)
+        return data
+    
+    def readall(self) -> bytes:
+        self._check()
+        data = bytes(self._view[self._pos:])
+        self._pos = len(self._view)
+        return data
+    
+    def seek(self, pos, whence=io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += len(self._view)
+        self._pos = max(0, pos)
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+
+
+class MappedZipFS(ReadZipFS):
+    """
+    ReadZipFS that serves stored (ZIP_STORED) members straight from an mmap of the archive.
+    The central directory is parsed once by zipfile; deflated members are inflated by it as usual.
+    
+    An archive rewritten in place (plugin packing, copying a new version over it) would make the
+    map return other bytes at the cached offsets or SIGBUS past the new end, so the file is
+    re-stat'ed before a view is handed out or read; a changed archive is only read through zipfile.
+    """
+    
+    _LOCAL_HEADER = struct.Struct("<4s22xHH")
+    
+    def __init__(self, file: str, encoding="utf-8"):
+        self._path = os.fspath(file)
+        # taken before parsing: a change while opening shows up as stale
+        try:
+            stat = os.stat(self._path)
+            self.stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # ReadZipFS raises its usual CreateFailed below
+            self.stamp = None
+        self._stale = False
+        super().__init__(file, encoding)
+        # io.open: builtins.open may be replaced by OpenManager
+        with io.open(file, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map).toreadonly()
+        self._spans: dict[str, Optional[slice]] = {}
+    
+    def isStale(self) -> bool:
+        """Whether the archive was rewritten or removed since it was opened"""
+        if not self._stale:
+            try:
+                stat = os.stat(self._path)
+                self._stale = (stat.st_mtime_ns, stat.st_size) != self.stamp
+            except OSError:
+                self._stale = True
+            if self._stale:
+                logger.debug(f"Archive changed on disk, reading without the map: {self._path}")
+        return self._stale
+    
+    def _mapped(self) -> bool:
+        return not self.isStale()
+    
+    def _span(self, name: str) -> Optional[slice]:
+        try:
+            return self._spans[name]
+        except KeyError:
+            pass
+        
+        span = None
+        try:
+            info = self._zip.getinfo(name)
+        except KeyError:
+            info = None
+        # encrypted members and ones whose sizes disagree go through zipfile
+        if (info is not None and info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1
+                and info.compress_size == info.file_size):
+            offset = info.header_offset
+            signature, name_size, extra_size = self._LOCAL_HEADER.unpack_from(self._map, offset)
+            if signature == b"PK\x03\x04":
+                start = offset + self._LOCAL_HEADER.size + name_size + extra_size
+                span = slice(start, start + info.file_size)
+        self._spans[name] = span
+        return span
+    
+    def _stored(self, path) -> Optional[memoryview]:
+        self.check()
+        if self.isStale():
+            return None
+        span = self._span(relpath(normpath(path)))
+        return None if span is None else self._view[span]
+    
+    def openbin(self, path, mode="r", buffering=-1, **kwargs):
+        if "w" in mode or "+" in mode or "a" in mode:
+            raise errors.ResourceReadOnly(path)
+        data = self._stored(path)
+        if data is None:
+            return super().openbin(path, mode, buffering, **kwargs)
+        return BufferReader(data, path, self._mapped)
+    
+    def readbytes(self, path):
+        data = self._stored(path)
+        return super().readbytes(path) if data is None else bytes(data)
+    
+    def getbuffer(self, path) -> memoryview:
+        """Content of a member; stored ones are not copied (read-only, valid until the archive is replaced)"""
+        data = self._stored(path)
+        return memoryview(super().readbytes(path)) if data is None else data
+    
+    def read_many(self, patterns: Iterable[str], path: str = "/") -> dict[str, Union[memoryview, bytes]]:
+        """
+        Members under ``path`` matching any of ``patterns`` (fs.glob syntax, relative to ``path``),
+        read in one pass in archive order. Keys are paths relative to ``path``.
+        """
+        self.check()
+        patterns = [pattern if pattern.startswith("/") else f"/{pattern}" for pattern in patterns]
+        exact = {pattern for pattern in patterns if not any(c in pattern for c in "*?[")}
+        patterns = [pattern for pattern in patterns if pattern not in exact]
+        base = relpath(normpath(path))
+        prefix = f"{base}/" if base else ""
+        mapped = not self.isStale()
+        
+        result = {}
+        for info in sorted(self._zip.infolist(), key=lambda item: item.header_offset):
+            if info.is_dir() or not info.filename.startswith(prefix):
+                continue
+            name = info.filename[len(prefix):]
+            if f"/{name}" in exact or any(match(pattern, f"/{name}") for pattern in patterns):
+                span = self._span(info.filename) if mapped else None
+                result[name] = self._zip.read(info) if span is None else self._view[span]
+        return result
+    
+    def close(self):
+        super().close()
+        if not hasattr(self, "_view"):
+            # the archive could not be opened
+            return
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # readers still hold slices, the map goes away with them
+            pass
+
+
+def archiveOf(fs: FS) -> Optional[MappedZipFS]:
+    """The pooled archive under wrapper and sub filesystems, None for other filesystems"""
+    while not isinstance(fs, MappedZipFS):
+        fs = getattr(fs, "_wrap_fs", None)
+        if fs is None:
+            return None
+    return fs
+
+
+def readBuffer(fs: FS, path: str) -> Union[memoryview, bytes]:
+    """
+    Content of a file without a copy where the FS can give it (stored zip members, Qt resources),
+    otherwise ``readbytes``. Wrapper and sub filesystems are unwrapped first.
+    """
+    while hasattr(fs, "delegate_path"):
+        fs, path = fs.delegate_path(path)
+    getbuffer = getattr(fs, "getbuffer", None)
+    if getbuffer is not None:
+        return getbuffer(path)
+    return fs.readbytes(path)
+
+
+def readMany(fs: FS, patterns: Iterable[str], path: str = "/") -> dict[str, Union[memoryview, bytes]]:
+    """
+    Files under ``path`` matching ``patterns`` (fs.glob syntax), keyed by path relative to ``path``.
+    Archives are read in one pass (``read_many``), other filesystems file by file.
+    """
+    while hasattr(fs, "delegate_path"):
+        fs, path = fs.delegate_path(path)
+    read_many = getattr(fs, "read_many", None)
+    if read_many is not None:
+        return read_many(patterns, path)
+    
+    folder = fs if relpath(normpath(path)) == "" else fs.opendir(path)
+    names = []
+    for pattern in patterns:
+        if not any(c in pattern for c in "*?["):
+            if folder.isfile(pattern):
+                names.append(pattern)
+            continue
+        names.extend(found.path for found in folder.glob(pattern) if found.info.is_file)
+    
+    result = {}
+    for name in names:
+        # a missing name is left out, as in read_many of archives (isfile of qt:// is not reliable)
+        try:
+            result[relpath(name)] = readBuffer(folder, name)
+        except (errors.ResourceNotFound, FileNotFoundError):
+            logger.debug(f"File not found, skipped: {name}")
+    return result
+
+
+class MetaSingPool(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class ArchivePool(metaclass=MetaSingPool):
+    """
+    Shared read-only zip filesystems keyed by archive path.
+    The central directory is parsed once per archive; an entry is reopened when the archive's
+    mtime or size changes and the least recently used one is dropped above ``capacity``.
+    Dropped handles are closed; files already opened from them finish normally (zipfile and the
+    map stay alive until their last reader is done), and UrlResolver reopens closed ones.
+    """
+    
+    def __init__(self, capacity: int = 32):
+        self.capacity = capacity
+        self._items: OrderedDict[str, tuple[tuple[int, int], FS]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+    
+    def get(self, path: str) -> FS:
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # let the zip filesystem raise its usual error
+            return MyWrapReadOnly(MappedZipFS(path))
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            cached = self._items.get(path)
+            if cached is not None:
+                if cached[0] == key:
+                    self._items.move_to_end(path)
+                    self.hits += 1
+                    return cached[1]
+                logger.debug(f"Archive changed on disk, reopening: {path}")
+                self.invalidations += 1
+                self._close(self._items.pop(path)[1])
+            
+            self.misses += 1
+            zipfs = MyWrapReadOnly(MappedZipFS(path))
+            self._items[path] = (key, zipfs)
+            while len(self._items) > self.capacity:
+                self._close(self._items.popitem(last=False)[1][1])
+                self.evictions += 1
+            return zipfs
+    
+    def release(self, path: str = None):
+        """Closes and forgets one archive (or all), e.g. before it is replaced on Windows"""
+        with self._lock:
+            if path is None:
+                items = list(self._items.values())
+                self._items.clear()
+            else:
+                item = self._items.pop(os.path.abspath(path), None)
+                items = [item] if item is not None else []
+        for _, zipfs in items:
+            self._close(zipfs)
+    
+    @staticmethod
+    def _close(zipfs: FS):
+        try:
+            # the read-only wrapper does not close what it wraps
+            zipfs.close()
+            archiveOf(zipfs).close()
+        except Exception as e:
+            logger.debug(f"Failed to close archive: {e}", exc_info=True)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "size": len(self._items),
+            }
+
+
+class MetaSingListing(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class ListingCache(metaclass=MetaSingListing):
+    """
+    Directory listings. A real folder is re-read only when its mtime or its generation
+    (bumped by the file watcher) changes; Qt resource folders only after invalidate().
+    """
+    
+    def __init__(self):
+        self._items: dict[tuple[str, str], tuple[Optional[int], int, tuple[str, ...]]] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, folder: str, flavour: str, build: Callable[[], Iterable[str]],
+            stamp: Optional[int] = None) -> list[str]:
+        key = (folder, flavour)
+        generation = self._generations.get(folder, 0)
+        cached = self._items.get(key)
+        if cached is not None and cached[0] == stamp and cached[1] == generation:
+            self.hits += 1
+            return list(cached[2])
+        
+        names = tuple(build())
+        with self._lock:
+            self.misses += 1
+            self._items[key] = (stamp, generation, names)
+        return list(names)
+    
+    def listdir(self, folder: str, suffix: str = "") -> list[str]:
+        """Names in a real folder that end with ``suffix``"""
+        folder = os.path.abspath(folder)
+        stamp = os.stat(folder).st_mtime_ns
+        
+        def build():
+            with os.scandir(folder) as entries:
+                return [entry.name for entry in entries if entry.name.endswith(suffix)]
+        
+        return self.get(folder, suffix, build, stamp)
+    
+    def invalidate(self, folder: Optional[str] = None):
+        with self._lock:
+            if folder is None:
+                self._items.clear()
+                return
+            folder = folder if folder.startswith(":") else os.path.abspath(folder)
+            self._generations[folder] = self._generations.get(folder, 0) + 1
+    
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._items)}
+
+
 class ZipFormatFile(OSFS):
     suffix_file = ""
     
@@ -23,7 +428,7 @@ class ZipFormatFile(OSFS):
         self.check()
         _path = pathlib.Path(self.validatepath(path).lstrip("\\").lstrip("/"))
         folder, parts = self._getRootPlugin(_path)
-        _zipfs = MyWrapReadOnly(open_fs(f"zip://{self.root_path}/{folder}.{self.suffix_file}", False))
+        _zipfs = ArchivePool().get(f"{self.root_path}/{folder}.{self.suffix_file}")
         if not len(parts):
             return _zipfs
         else:
@@ -58,8 +463,9 @@ class ZipFormatFile(OSFS):
     def listdir(self, path):
         self.check()
         _path = self.validatepath(path)
-        sys_path = pathlib.Path(self._to_sys_path(_path).decode("utf-8"))
-        return [file.stem for file in sys_path.iterdir() if file.suffix == f".{self.suffix_file}"]
+        sys_path = self._to_sys_path(_path).decode("utf-8")
+        suffix = f".{self.suffix_file}"
+        return [name[:-len(suffix)] for name in ListingCache().listdir(sys_path, suffix) if name != suffix]
 
 
 class BasePathOpener(Opener):
@@ -82,32 +82,29 @@ class ResourcePathOpener(BasePathOpener):
         TYPE_RESOURCE = "resource"
         TYPE_OVERLAY_ADDONS = "overlay_addons"
     
-    def __init__(self):
-        self.typeResource = self.TypeResource.TYPE_NOT_TYPE
-    
     def open_fs(self, fs_url: str, parse_result: ParseResult, writeable: bool, create: bool, cwd: str) -> FS:
         path: str = parse_result.resource
         parts = fs_path.parts(path)
         if parts[1].lower() == "NOT_TYPE":
             raise errors.ResourceNotFound(path)
         try:
-            self.TypeResource(parts[1].lower())
+            typeResource = self.TypeResource(parts[1].lower())
         except ValueError as e:
             raise errors.ResourceNotFound(path, e)
-        self.typeResource = self.TypeResource(parts[1].lower())
         parts.pop(1)
+        # The opener is a shared registry singleton: the type travels with the parse result
         result = ParseResult(
             parse_result.protocol,
             parse_result.username,
             parse_result.password,
             fs_path.join(*parts),
-            parse_result.params,
+            {**parse_result.params, "type": typeResource},
             parse_result.path
         )
         return super().open_fs(fs_url, result, writeable, create, cwd)
     
     def getImplFS(self, url, parse_result, writable, create, cwd) -> FS:
-        match self.typeResource:
+        match parse_result.params.get("type"):
             case self.TypeResource.TYPE_THEME:
                 return MyWrapReadOnly(ThemeFS())
             case self.TypeResource.TYPE_RESOURCE:
@@ -2,14 +2,15 @@ import datetime
 import io
 from typing import Optional, Union
 
-from PySide6.QtCore import QFileInfo, QDir, QFile, QIODevice, QBuffer, QDataStream, QByteArray, QTextStream
+from PySide6.QtCore import (QFileInfo, QDir, QFile, QIODevice, QBuffer, QDataStream, QByteArray, QTextStream,
+                            QResource)
 from fs import ResourceType, errors
 from fs.base import FS
 from fs.info import Info
 from fs.mode import Mode
 from fs.opener import registry
 
-from .fs_base import BasePathOpener
+from .fs_base import BasePathOpener, BufferReader, ListingCache
 
 
 class BinaryFileDescriptor:
@@ -151,6 +152,24 @@ class BinaryFileDescriptor:
         self.file.resize(size)
 
 
+class QResourceReader(BufferReader):
+    """
+    Read-only file over a Qt resource without intermediate copies.
+    Uncompressed data is read straight from the registered bundle (QResource.data() is a view on it),
+    compressed data is inflated once. ``getbuffer()`` gives the whole content as a read-only memoryview.
+    """
+    
+    def __init__(self, path: str):
+        self._resource = QResource(path)
+        if not self._resource.isValid() or self._resource.isDir():
+            raise errors.ResourceNotFound(path)
+        if self._resource.compressionAlgorithm() == QResource.Compression.NoCompression:
+            self._data = self._resource.data()
+        else:
+            self._data = self._resource.uncompressedData()
+        super().__init__(self._data, path)
+
+
 class QrcFS(FS):
     
     def getinfo(self, path, namespaces=None):
@@ -169,7 +188,8 @@ class QrcFS(FS):
         return Info(raw_info)
     
     def listdir(self, path):
-        return QDir(f":/{path.lstrip('/')}").entryList()
+        folder = f":/{path.lstrip('/')}"
+        return ListingCache().get(folder, "qrc", lambda: QDir(folder).entryList())
     
     def makedir(self, path, permissions=None, recreate=False):
         raise errors.ResourceReadOnly("Не возможно создать папку")
@@ -177,7 +197,15 @@ class QrcFS(FS):
     def openbin(self, path, mode="r", buffering=-1, **options):
         _mode = Mode(mode)
         _mode.validate(set("rtb"))
-        return BinaryFileDescriptor(f":/{path.lstrip('/')}", _mode.to_platform_bin(), buffering, **options)
+        return QResourceReader(f":/{path.lstrip('/')}")
+    
+    def readbytes(self, path):
+        with QResourceReader(f":/{path.lstrip('/')}") as file:
+            return file.readall()
+    
+    def getbuffer(self, path) -> memoryview:
+        """Content of a resource without copying (read-only)"""
+        return QResourceReader(f":/{path.lstrip('/')}").getbuffer()
     
     def remove(self, path):
         raise errors.ResourceReadOnly("Нельзя удалить")
@@ -212,6 +240,16 @@ class FileStorage:
         self._encoding = encoding
         self._text_stream: Optional[QTextStream] = None
         self._buffer = io.StringIO() if 't' in mode else io.BytesIO()
+        # Ресурсы только читаются: данные отдаются без копии в буфер, QFile не открывается
+        self._resource = filename.startswith(":/") and not any(c in mode for c in "wa+")
+        
+        if self._resource:
+            try:
+                reader = QResourceReader(filename)
+            except errors.ResourceNotFound:
+                raise IOError(f"Could not open file {filename} in mode {mode}")
+            self._buffer = io.TextIOWrapper(reader, encoding=encoding) if 'b' not in mode else reader
+            return
         
         qt_mode = self._parse_mode(mode)
         if not self._file.open(qt_mode):
@@ -297,7 +335,9 @@ class FileStorage:
     
     def close(self) -> None:
         """Закрывает файл"""
-        if self._file.isOpen():
+        if self._resource:
+            self._buffer.close()
+        elif self._file.isOpen():
             self.flush()
             self._file.close()
     
@@ -339,4 +379,6 @@ class FileStorage:
     @property
     def closed(self) -> bool:
         """Проверяет, закрыт ли файл"""
+        if self._resource:
+            return self._buffer.closed
         return not self._file.isOpen()
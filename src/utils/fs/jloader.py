@@ -1,21 +1,49 @@
+import os
+import threading
+from typing import Optional
+
 import fs
 import fs.path
 import fs.errors
-from jinja2 import BaseLoader, TemplateNotFound
+from jinja2 import BaseLoader, ChoiceLoader, FileSystemBytecodeCache, TemplateNotFound
+from jinja2.utils import internalcode
+
+from .bootstrap import getAppPath
+
+CACHE_ENV = "OVERLAY_BYTECODE_CACHE"
 
 
 class FSLoader(BaseLoader):
+    """
+    Templates from an fs url. A loaded template stays up to date until ``invalidate``
+    is called for it (archives do not change under a running app without the file watcher noticing).
+    """
     
     def __init__(self, template_fs, encoding='utf-8', use_syspath=False, fs_filter=None):
+        self.url = template_fs.rstrip("/")
         self.filesystem = fs.open_fs(template_fs)
         self.use_syspath = use_syspath
         self.encoding = encoding
         self.fs_filter = fs_filter
+        self._epoch = 0
+        self._generations: dict[str, int] = {}
+    
+    def _stamp(self, root: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(root, 0)
+    
+    def invalidate(self, root: Optional[str] = None):
+        """Marks all templates, or the ones under the top folder ``root`` (a plugin), as changed"""
+        if root is None:
+            self._epoch += 1
+        else:
+            self._generations[root] = self._generations.get(root, 0) + 1
     
     def get_source(self, environment, template):
         if not self.filesystem.isfile(template):
             raise TemplateNotFound(template)
-        reload = lambda: False
+        root = fs.path.iteratepath(template)[0]
+        stamp = self._stamp(root)
+        reload = lambda: self._stamp(root) == stamp
         try:
             with self.filesystem.open(template, encoding=self.encoding) as input_file:
                 source = input_file.read()
@@ -24,7 +52,8 @@ class FSLoader(BaseLoader):
                     return source, self.filesystem.getsyspath(template), reload
                 elif self.filesystem.hasurl(template):
                     return source, self.filesystem.geturl(template), reload
-            return source, template, reload
+            # the url keeps bytecode cache keys of equal names in different loaders apart
+            return source, f"{self.url}/{template}", reload
         except OSError:
             raise TemplateNotFound(template)
     
@@ -33,3 +62,77 @@ class FSLoader(BaseLoader):
         for file in self.filesystem.walk.files(filter=self.fs_filter):
             found.add(fs.path.relpath(file))
         return sorted(found)
+
+
+class ChoiceFSLoader(ChoiceLoader):
+    """ChoiceLoader that remembers which loader served a template instead of asking each one again"""
+    
+    def __init__(self, loaders):
+        super().__init__(loaders)
+        self._resolved: dict[str, BaseLoader] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _resolve(self, name: str, call):
+        loader = self._resolved.get(name)
+        if loader is not None:
+            try:
+                result = call(loader)
+                self.hits += 1
+                return result
+            except TemplateNotFound:
+                with self._lock:
+                    self._resolved.pop(name, None)
+        
+        self.misses += 1
+        for loader in self.loaders:
+            try:
+                result = call(loader)
+            except TemplateNotFound:
+                continue
+            with self._lock:
+                self._resolved[name] = loader
+            return result
+        raise TemplateNotFound(name)
+    
+    def get_source(self, environment, template):
+        return self._resolve(template, lambda loader: loader.get_source(environment, template))
+    
+    @internalcode
+    def load(self, environment, name, globals=None):
+        return self._resolve(name, lambda loader: loader.load(environment, name, globals))
+    
+    def invalidate(self, root: Optional[str] = None):
+        """Forgets resolved names (all or under ``root``) and marks them changed in the loaders"""
+        with self._lock:
+            if root is None:
+                self._resolved.clear()
+            else:
+                for name in [name for name in self._resolved if fs.path.iteratepath(name)[0] == root]:
+                    del self._resolved[name]
+        for loader in self.loaders:
+            if hasattr(loader, "invalidate"):
+                loader.invalidate(root)
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Compiled templates in .cache/jinja, shared between launches.
+    Jinja checks the sha1 of the source against the stored one, so a changed template
+    (or archive) is recompiled once and other entries stay valid.
+    """
+    
+    def __init__(self, directory: Optional[str] = None):
+        directory = directory or str(getAppPath() / ".cache" / "jinja")
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(directory, "%s.jbc")
+        self.enabled = os.environ.get(CACHE_ENV, "1").lower() not in ("0", "false", "no")
+    
+    def load_bytecode(self, bucket):
+        if self.enabled:
+            super().load_bytecode(bucket)
+    
+    def dump_bytecode(self, bucket):
+        if self.enabled:
+            super().dump_bytecode(bucket)
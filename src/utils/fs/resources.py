@@ -0,0 +1,42 @@
+import os
+import logging
+
+from PySide6.QtCore import QResource
+
+from .bootstrap import getAssetsPath
+from .fs_base import ListingCache
+
+logger = logging.getLogger(__name__)
+
+RCC_FILE = "assets.rcc"
+RESOURCES_ENV = "OVERLAY_RESOURCES"
+
+
+def getResourceBundle():
+    """Binary bundle built with ``pyside6-rcc --binary assets.qrc -o assets.rcc``"""
+    return getAssetsPath().parent / RCC_FILE
+
+
+def registerResources() -> str:
+    """
+    Registers the app resources (:/root, :/i18n, ...) and returns the source used.
+    "rcc": assets.rcc registered with QResource, Qt maps the file and pages data in on access.
+    "module": the compiled assets_rc module, all data is unmarshalled into the heap.
+    OVERLAY_RESOURCES=module|rcc forces one of them.
+    """
+    mode = os.environ.get(RESOURCES_ENV, "auto").lower()
+    bundle = getResourceBundle()
+    
+    if mode != "module":
+        if bundle.exists() and QResource.registerResource(str(bundle)):
+            logger.info(f"Resources registered from bundle: {bundle}")
+            ListingCache().invalidate()
+            return "rcc"
+        if mode == "rcc" or bundle.exists():
+            logger.warning(f"Resource bundle is not available: {bundle}. Using assets_rc")
+    
+    # noinspection PyUnresolvedReferences
+    import assets_rc
+    ListingCache().invalidate()
+    logger.info("Resources registered from assets_rc")
+    return "module"
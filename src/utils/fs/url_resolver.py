@@ -0,0 +1,214 @@
+import builtins
+import threading
+import logging
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Union
+
+from fs import errors, open_fs, path as fs_path
+from fs.base import FS
+
+from core.context import _current_plugin
+from .fs_base import MappedZipFS, archiveOf, readBuffer, readMany
+
+logger = logging.getLogger(__name__)
+
+SCHEME_HINTS = {
+    "s3": "Установите плагин: pip install fs-s3fs",
+    "gs": "Установите плагин: pip install fs-gcsfs",
+    "http": "Для HTTP/HTTPS требуется fs-http",
+    "ftp": "Для FTP требуется fs-ftp",
+}
+
+# Пути этих схем отсчитываются от папки активного плагина
+CONTEXT_SCHEMES = ("plugin", "pldata")
+
+_original_open = builtins.open
+
+
+class MetaSingResolver(type):
+    _instance = None
+    
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+def _isWriteMode(mode: str) -> bool:
+    return any(c in mode for c in ("w", "a", "+", "x"))
+
+
+class UrlResolver(metaclass=MetaSingResolver):
+    """
+    Resolves ``scheme://dir/file`` to an opened FS and a file name.
+    Each scheme gets a compiled handler on first use; opened directories are kept in an LRU
+    keyed by (scheme, plugin context, directory, create) so active plugins do not evict each other.
+    A directory inside an archive is reopened through ArchivePool once the archive is closed or
+    changed on disk, with or without the file watcher.
+    """
+    
+    def __init__(self, size: int = 64):
+        self.size = size
+        self._handlers: dict[str, Callable[[str, str, bool], tuple]] = {}
+        # key -> (opened directory, archive it lives in)
+        self._cache: OrderedDict[tuple, tuple[FS, Optional[MappedZipFS]]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def resize(self, size: int):
+        with self._lock:
+            self.size = max(1, int(size))
+            self._trim()
+    
+    def invalidate(self, scheme: Optional[str] = None, root: Optional[str] = None):
+        """
+        Drops cached FS objects: all, of one scheme, or of one scheme under ``root``
+        (``MyPlugin`` for plugin://, ``theme/Dark`` for resource://), e.g. after an archive was replaced
+        """
+        with self._lock:
+            if scheme is None:
+                self._cache.clear()
+                return
+            root = root.strip("/") if root else None
+            for key in list(self._cache):
+                if key[0] != scheme:
+                    continue
+                folder = key[2].strip("/")
+                if root is None or folder == root or folder.startswith(f"{root}/"):
+                    del self._cache[key]
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._cache),
+                "capacity": self.size,
+                "schemes": sorted(self._handlers),
+            }
+    
+    def _trim(self):
+        while len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+    
+    def _compile(self, scheme: str) -> Callable[[str, str, bool], tuple]:
+        """Handler: (path, context, create) -> (cache key, basedir, basename)"""
+        if scheme in CONTEXT_SCHEMES:
+            def handler(path, context, create):
+                basedir, basename = fs_path.split(path)
+                if context != "App":
+                    basedir = f"{context}{basedir}"
+                return (scheme, context, basedir, create), basedir, basename
+        else:
+            def handler(path, context, create):
+                basedir, basename = fs_path.split(path)
+                return (scheme, None, basedir, create), basedir, basename
+        return handler
+    
+    def resolve(self, url: str, mode: str = "r") -> tuple[FS, str]:
+        scheme, path = url.split("://", 1)
+        handler = self._handlers.get(scheme)
+        if handler is None:
+            handler = self._handlers.setdefault(scheme, self._compile(scheme))
+        
+        create = "w" in mode or "x" in mode
+        key, basedir, basename = handler(path, _current_plugin.get(), create)
+        
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                fs, archive = cached
+                if archive is None or not (archive.isclosed() or archive.isStale()):
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return fs, basename
+                del self._cache[key]
+                self.invalidations += 1
+        
+        fs = self._open(scheme, basedir, create)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = (fs, archiveOf(fs))
+            self._trim()
+        return fs, basename
+    
+    @staticmethod
+    def _open(scheme: str, basedir: str, create: bool) -> FS:
+        try:
+            return open_fs(f"{scheme}://{basedir}")
+        except errors.ResourceNotFound as e:
+            if not create: raise e
+            return open_fs(f"{scheme}://").makedir(basedir)
+        except errors.CreateFailed as e:
+            hint = SCHEME_HINTS.get(scheme, "")
+            raise ImportError(
+                f"Не удалось открыть файловую систему {scheme}. {hint}\n{e}"
+            ) from e
+
+
+def _checkWritable(fs: FS, mode: str):
+    if _isWriteMode(mode):
+        try:
+            if not fs.getmeta().get("supports_write", True):
+                raise PermissionError("Файловая система доступна только для чтения")
+        except errors.Unsupported:
+            pass  # Если метаданные не поддерживаются
+
+
+def overlay_open(file, mode="r", *args, **kwargs):
+    """
+    ``open`` that understands plugin://, pldata://, project://, resource://, qt:// and other fs urls.
+    Works without the global ``builtins.open`` patch of OpenManager; other paths go to the real open.
+    """
+    if not (isinstance(file, str) and "://" in file):
+        return _original_open(file, mode, *args, **kwargs)
+    
+    try:
+        fs, filename = UrlResolver().resolve(file, mode)
+        _checkWritable(fs, mode)
+        return fs.open(filename, mode, *args, **kwargs)
+    except errors.ResourceError as e:
+        raise FileNotFoundError(
+            f"Файл не найден: {file}. Проверьте путь и права доступа."
+        ) from e
+    except errors.Unsupported as e:
+        raise ValueError(f"Неподдерживаемая операция: {e}") from e
+
+
+def overlay_buffer(file) -> Union[memoryview, bytes]:
+    """
+    Whole content of a path or fs url. Stored members of plugin and theme archives
+    and Qt resources are returned as read-only memoryviews without copying.
+    """
+    if not (isinstance(file, str) and "://" in file):
+        with _original_open(file, "rb") as handle:
+            return handle.read()
+    
+    try:
+        fs, filename = UrlResolver().resolve(file, "rb")
+        return readBuffer(fs, filename)
+    except errors.ResourceError as e:
+        raise FileNotFoundError(
+            f"Файл не найден: {file}. Проверьте путь и права доступа."
+        ) from e
+
+
+def read_many(url: str, patterns: Iterable[str]) -> dict[str, Union[memoryview, bytes]]:
+    """
+    Files of the folder ``url`` matching ``patterns`` (``*.svg``, ``**/*.css``, exact names), keyed by
+    relative path. Plugin, theme and resource archives are read in one pass in member order.
+    Names that do not exist are left out.
+    """
+    try:
+        fs, _ = UrlResolver().resolve(url if url.endswith("/") else f"{url}/", "rb")
+        return readMany(fs, patterns)
+    except errors.ResourceError as e:
+        raise FileNotFoundError(
+            f"Папка не найдена: {url}. Проверьте путь и права доступа."
+        ) from e
@@ -1,2 +1,31 @@
-from .enums import *
-from .emitter import EmitterFakeInput
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .enums import BaseCommonKey, BaseWindowsKey, BaseLinuxKey
+    from .emitter import EmitterFakeInput
+
+# Резолвятся при первом обращении (PEP 562)
+_exports = {
+    "BaseCommonKey": ".enums",
+    "BaseWindowsKey": ".enums",
+    "BaseLinuxKey": ".enums",
+    "EmitterFakeInput": ".emitter",
+}
+
+__all__ = ["BaseCommonKey", "BaseWindowsKey", "BaseLinuxKey", "EmitterFakeInput"]
+
+
+def __getattr__(name):
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# getAppPath() is the working directory and is cached on first use,
+# so every test shares one temporary app folder
+APP = Path(tempfile.mkdtemp(prefix="overlay-tests-"))
+for folder in ("plugins", "resource", "configs"):
+    (APP / folder).mkdir()
+os.chdir(APP)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(SRC))
+
+import core.context_global  # noqa: E402  registers the fs openers
+
+
+@pytest.fixture(scope="session")
+def app_path() -> Path:
+    return APP
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,45 @@
+import zipfile
+
+from utils.fs.fs_base import ArchivePool, archiveOf
+
+
+def make_archive(path, members: dict):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def test_release_closes_and_keeps_open_readers(tmp_path):
+    path = make_archive(tmp_path / "Pool.plugin", {"data.txt": b"x" * 4096})
+    pool = ArchivePool()
+    zipfs = pool.get(path)
+    reader = zipfs.openbin("data.txt")
+    
+    pool.release(path)
+    
+    assert zipfs.isclosed()
+    assert archiveOf(zipfs).isclosed()
+    assert reader.read() == b"x" * 4096
+    reader.close()
+    assert pool.get(path) is not zipfs
+    pool.release(path)
+
+
+def test_evicted_and_replaced_handles_are_closed(tmp_path):
+    pool = ArchivePool()
+    capacity, pool.capacity = pool.capacity, 1
+    try:
+        first = make_archive(tmp_path / "First.plugin", {"a.txt": b"a"})
+        second = make_archive(tmp_path / "Second.plugin", {"b.txt": b"b"})
+        evicted = pool.get(first)
+        pool.get(second)
+        assert archiveOf(evicted).isclosed()
+        
+        replaced = pool.get(second)
+        make_archive(second, {"b.txt": b"changed"})
+        assert pool.get(second).readbytes("b.txt") == b"changed"
+        assert archiveOf(replaced).isclosed()
+    finally:
+        pool.capacity = capacity
+        pool.release()
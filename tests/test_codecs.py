@@ -0,0 +1,27 @@
+import logging
+import tomllib
+
+import pytest
+
+from utils import codecs
+
+
+def test_unknown_backend_keeps_the_current_one(caplog):
+    current = codecs.codec("toml").name
+    with caplog.at_level(logging.WARNING, logger="utils.codecs"):
+        assert not codecs.trySetCodec("toml", "nope")
+    assert codecs.codec("toml").name == current
+    assert "nope" in caplog.text
+
+
+def test_tomllib_falls_back_to_toml_with_a_warning(caplog):
+    # a raw control character: accepted by the toml package, rejected by TOML 1.0
+    text = 'name = "a\x7fb"\n'
+    with caplog.at_level(logging.WARNING, logger="utils.codecs"):
+        assert codecs.codec("toml", "tomllib").loads(text) == {"name": "a\x7fb"}
+    assert "deprecated" in caplog.text
+
+
+def test_tomllib_error_is_kept_when_both_fail():
+    with pytest.raises(tomllib.TOMLDecodeError):
+        codecs.codec("toml", "tomllib").loads("name = \n")
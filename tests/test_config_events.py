@@ -0,0 +1,22 @@
+from pydantic import ConfigDict
+
+from core.config import ConfigCache
+from core.default_configs.base_config import BaseConfig
+from core.service.fs_watcher import FsChange, FsEvent, evictConfigs
+
+
+class Watched(BaseConfig):
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+
+def test_config_event_rereads_the_file(app_path):
+    path = app_path / "configs" / "watched.toml"
+    url = "project://configs/watched.toml"
+    path.write_text("value = 1\n", encoding="utf-8")
+    assert ConfigCache().get(url, Watched).value == 1
+    
+    path.write_text("value = 2\n", encoding="utf-8")
+    assert ConfigCache().get(url, Watched).value == 1
+    
+    evictConfigs([FsEvent("config", FsChange.MODIFIED, path, path.stem)])
+    assert ConfigCache().get(url, Watched).value == 2
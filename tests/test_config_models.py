@@ -0,0 +1,46 @@
+import dataclasses
+import zipfile
+
+import pytest
+
+from core.config import Config
+from core.default_configs.plugin_config import Settings, WindowSettings
+
+PLUGIN_TOML = """
+[metadata]
+name = "Frozen"
+author = "tests"
+version = "Beta 1.0.0 - stable"
+description = "Shared config"
+
+[settings]
+style_file = "style.css"
+
+[settings.window]
+width = 300
+height = 120
+opacity = 0.85
+"""
+
+
+@pytest.fixture(scope="module")
+def plugin(app_path):
+    with zipfile.ZipFile(app_path / "plugins" / "Frozen.plugin", "w") as archive:
+        archive.writestr("plugin.toml", PLUGIN_TOML)
+    return "Frozen"
+
+
+def test_shared_model_is_read_only(plugin):
+    config = Config(plugin, "window")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.data.settings.window.width = 10
+
+
+def test_override_does_not_leak_into_duplicates(plugin):
+    first, second = Config(plugin, "window"), Config(plugin, "window")
+    assert first.data is second.data
+    
+    first.override(settings=Settings("style.css", WindowSettings(10, 20, 1.0)))
+    
+    assert first.data.settings.window.width == 10
+    assert second.data.settings.window.width == 300
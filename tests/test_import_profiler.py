@@ -0,0 +1,70 @@
+import sys
+import threading
+import importlib
+
+import pytest
+
+from core.service.import_profiler import ImportProfiler
+
+SLOW = "import time\ntime.sleep(0.005)\n"
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    for package in ("profiled_a", "profiled_b"):
+        folder = tmp_path / package
+        folder.mkdir()
+        (folder / "__init__.py").write_text("")
+        for index in range(10):
+            (folder / f"mod{index}.py").write_text(SLOW)
+    (tmp_path / "profiled_gone.py").write_text("")
+    (tmp_path / "profiled_drop.py").write_text("import sys\nsys.modules.pop('profiled_gone')\n")
+    sys.path.insert(0, str(tmp_path))
+    importlib.invalidate_caches()
+    importlib.import_module("profiled_a")
+    importlib.import_module("profiled_b")
+    
+    # a private instance, the app's singleton stays untouched
+    instance = ImportProfiler.__new__(ImportProfiler)
+    instance.__init__()
+    instance.install()
+    yield instance
+    instance.uninstall()
+    sys.path.remove(str(tmp_path))
+    for name in [name for name in sys.modules if name.startswith("profiled_")]:
+        del sys.modules[name]
+
+
+def profiled(profiler) -> list:
+    return [record for record in profiler.records if record.name.startswith("profiled_")]
+
+
+def test_modules_of_other_threads_are_not_attributed(profiler):
+    start = threading.Barrier(2)
+    
+    # import_module, since PySide swaps builtins.__import__ while its own hook runs
+    def worker(package: str):
+        start.wait()
+        for index in range(10):
+            importlib.import_module(f"{package}.mod{index}")
+    
+    threads = [threading.Thread(target=worker, args=(package,), name=package) for package in ("profiled_a", "profiled_b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    records = profiled(profiler)
+    assert sorted(record.name for record in records) == sorted(
+        f"{package}.mod{index}" for package in ("profiled_a", "profiled_b") for index in range(10)
+    )
+    assert all(record.name.startswith(record.thread) for record in records)
+
+
+def test_removed_modules_do_not_hide_new_ones(profiler):
+    importlib.import_module("profiled_gone")
+    profiler.records.clear()
+    
+    importlib.import_module("profiled_drop")
+    
+    assert [record.name for record in profiled(profiler)] == ["profiled_drop"]
@@ -0,0 +1,90 @@
+import sys
+import zipfile
+from contextlib import contextmanager
+
+import pytest
+
+pytest.importorskip("ldt")
+
+from core.loaders.archive_index import ArchiveIndex
+from core.loaders.plugin_loader import PluginLoader, LazyPluginModule
+from plugins.preloaders import WindowPreLoader
+
+PLUGIN_TOML = """
+[metadata]
+name = "{name}"
+version = "1.0.0"
+
+[settings]
+style_file = "style.css"
+
+[settings.window]
+width = 100
+height = 100
+opacity = 1.0
+"""
+
+
+class FakeSettings:
+    """The part of NexusStore that PreLoader.load_group uses"""
+    
+    def __init__(self, groups: dict):
+        self._groups = groups
+        self._path: list[str] = []
+    
+    def _current(self) -> dict:
+        node = self._groups
+        for key in self._path:
+            node = node[key]
+        return node
+    
+    @contextmanager
+    def group_context(self, name):
+        self._path.append(name)
+        try:
+            yield
+        finally:
+            self._path.pop()
+    
+    def childGroups(self):
+        return [key for key, value in self._current().items() if isinstance(value, dict)]
+    
+    def value(self, key, default=None, type_=None):
+        return self._current().get(key, default)
+
+
+class FakeList:
+    def findItemBySaveName(self, name):
+        return None
+
+
+class FakeParent:
+    listPlugins = FakeList()
+
+
+def build_plugin(app_path, name):
+    with zipfile.ZipFile(app_path / "plugins" / f"{name}.plugin", "w") as archive:
+        archive.writestr("plugin.toml", PLUGIN_TOML.format(name=name))
+        archive.writestr(f"{name}.py", "raise RuntimeError('imported')\n")
+
+
+def test_inactive_saved_plugin_stays_unloaded(app_path, qapp, monkeypatch):
+    name = "LazyInactive"
+    build_plugin(app_path, name)
+    monkeypatch.setattr(ArchiveIndex, "_instance", None)
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    
+    loader = PluginLoader(lazy=True)
+    loader.load()
+    placeholder = sys.modules[name]
+    assert isinstance(placeholder, LazyPluginModule)
+    
+    settings = FakeSettings({"windows": {f"{name}_1": {"module": name, "active": False, "orig_name": name}}})
+    loaded = list(WindowPreLoader.load_group("windows", settings, FakeParent()))
+    
+    assert len(loaded) == 1
+    target, item = loaded[0]
+    assert target is None
+    assert item.module is placeholder
+    assert placeholder._module is None
+    assert sys.modules[name] is placeholder
@@ -0,0 +1,41 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import core.metadata as md
+from core.default_configs import MetaData
+from core.metadata.model import MetaDataFinder
+
+THREADS = 8
+CALLS = 2000
+
+
+class CountingFinder(MetaDataFinder):
+    def find_metadata(self, context):
+        if context.type != "counting":
+            return None
+        return MetaData(name=context.name, version="Beta 1.0.0 - stable", author="tests", description="")
+
+
+@pytest.fixture
+def finder():
+    md.registry(CountingFinder)
+    yield
+    md._meta_finders[:] = [item for item in md._meta_finders if not isinstance(item, CountingFinder)]
+    md.invalidate()
+
+
+def test_concurrent_lookups_count_every_call(finder):
+    before = md.metadata_stats()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(THREADS) as pool:
+            found = list(pool.map(lambda index: md.metadata(f"counting::Plugin{index % 4}"), range(CALLS)))
+    finally:
+        sys.setswitchinterval(interval)
+    
+    after = md.metadata_stats()
+    assert {item.name for item in found} == {f"Plugin{index}" for index in range(4)}
+    assert (after["hits"] + after["misses"]) - (before["hits"] + before["misses"]) == CALLS
@@ -0,0 +1,55 @@
+import ast
+import sys
+import json
+import subprocess
+
+from conftest import SRC
+
+# a plugin that only imports oapi must not pay for these
+HEAVY = [
+    "gui.owidget", "gui.owindow", "gui.themes", "core.cli", "plugins.flags_installer",
+    "utils.system", "utils.input.emitter", "utils.input.enums",
+    "evdev", "pulsectl", "pycaw", "cv2", "PIL", "textual",
+]
+
+# generous for slow CI machines; the eager facade took well over this
+BUDGET = 0.15
+
+PROBE = """
+import sys, time, json
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import oapi
+import utils.input
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def probe() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(src=str(SRC))],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_oapi_import_is_lazy():
+    loaded = set(probe()["modules"])
+    assert not loaded & set(HEAVY)
+
+
+def test_oapi_import_budget():
+    # best of three, the first run may pay for a cold disk cache
+    elapsed = min(probe()["elapsed"] for _ in range(3))
+    assert elapsed < BUDGET, f"import oapi took {elapsed * 1000:.0f} ms"
+
+
+def test_stub_declares_every_export():
+    import oapi
+    stub = ast.parse((SRC.parent / "overlay_sdk" / "oapi.pyi").read_text(encoding="utf-8"))
+    declared = {node.name for node in stub.body if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))}
+    exported = next(ast.literal_eval(node.value) for node in stub.body
+                    if isinstance(node, ast.Assign) and node.targets[0].id == "__all__")
+    assert sorted(exported) == sorted(oapi.__all__)
+    assert not set(oapi.__all__) - declared
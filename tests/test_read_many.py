@@ -0,0 +1,37 @@
+import subprocess
+import zipfile
+from pathlib import Path
+
+import pytest
+import PySide6
+from PySide6.QtCore import QResource
+
+from utils.fs import read_many
+
+RCC = Path(PySide6.__file__).parent / "Qt" / "libexec" / "rcc"
+
+
+@pytest.fixture(scope="module")
+def qt_folder(tmp_path_factory):
+    if not RCC.exists():
+        pytest.skip("rcc is not shipped with this PySide6")
+    root = tmp_path_factory.mktemp("qrc")
+    (root / "many").mkdir()
+    (root / "many" / "a.txt").write_bytes(b"hello")
+    (root / "many.qrc").write_text('<RCC><qresource prefix="/"><file>many/a.txt</file></qresource></RCC>')
+    subprocess.run([str(RCC), "--binary", "many.qrc", "-o", "many.rcc"], cwd=root, check=True)
+    assert QResource.registerResource(str(root / "many.rcc"))
+    yield "qt://many"
+    QResource.unregisterResource(str(root / "many.rcc"))
+
+
+def test_missing_name_is_skipped_on_qt(qt_folder):
+    found = read_many(qt_folder, ["a.txt", "missing.svg"])
+    assert {name: bytes(data) for name, data in found.items()} == {"a.txt": b"hello"}
+
+
+def test_missing_name_is_skipped_in_archives(app_path):
+    with zipfile.ZipFile(app_path / "plugins" / "Many.plugin", "w") as archive:
+        archive.writestr("icons/a.txt", b"hello")
+    found = read_many("plugin://Many/icons", ["a.txt", "missing.svg"])
+    assert {name: bytes(data) for name, data in found.items()} == {"a.txt": b"hello"}
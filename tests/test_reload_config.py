@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ldt")
+
+from core.config import ConfigDiff  # noqa: E402
+from gui.owidget import OWidget  # noqa: E402
+from gui.owindow import OWindow  # noqa: E402
+
+
+class FakeConfig:
+    """The part of Config that the base classes read on reload"""
+    
+    def __init__(self, diff: ConfigDiff):
+        self.name = "Custom"
+        self.diff = diff
+        window = SimpleNamespace(width=120, height=80, opacity=1.0)
+        self.data = SimpleNamespace(settings=SimpleNamespace(style_file="style.css", window=window, text="new"))
+    
+    def reload(self) -> ConfigDiff:
+        return self.diff
+
+
+class CustomWindow(OWindow):
+    def load_config(self):
+        super().load_config()
+        self.text = self.config.data.settings.text
+
+
+class CustomWidget(OWidget):
+    def load_config(self):
+        super().load_config()
+        self.text = self.config.data.settings.text
+
+
+@pytest.mark.parametrize("cls", [CustomWindow, CustomWidget])
+def test_reload_runs_overridden_load_config(qapp, cls):
+    plugin = cls(FakeConfig(ConfigDiff({"settings.text": ("old", "new")})))
+    plugin.text = "old"
+    
+    plugin.reload_config()
+    
+    assert plugin.text == "new"
+
+
+@pytest.mark.parametrize("cls", [CustomWindow, CustomWidget])
+def test_unchanged_reload_skips_load_config(qapp, cls):
+    plugin = cls(FakeConfig(ConfigDiff()))
+    plugin.text = "old"
+    
+    plugin.reload_config()
+    
+    assert plugin.text == "old"
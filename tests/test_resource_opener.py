@@ -0,0 +1,46 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fs import open_fs
+
+from utils.fs.fs_impl import ThemeFS, ResourceFS, OverlayAddonsFS
+
+TYPES = {
+    "theme": ThemeFS,
+    "resource": ResourceFS,
+    "overlay_addons": OverlayAddonsFS,
+}
+
+THREADS = 16
+ROUNDS = 500
+
+
+def unwrap(fs):
+    while hasattr(fs, "_wrap_fs"):
+        fs = fs._wrap_fs
+    return fs
+
+
+def test_concurrent_opens_get_their_own_type():
+    # switch threads as often as possible so opens interleave inside the shared opener
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    start = threading.Barrier(THREADS)
+    
+    def worker(index: int) -> list[tuple[str, type]]:
+        start.wait()
+        opened = []
+        for round_ in range(ROUNDS):
+            kind = list(TYPES)[(index + round_) % len(TYPES)]
+            opened.append((kind, type(unwrap(open_fs(f"resource://{kind}")))))
+        return opened
+    
+    try:
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = [item for opened in pool.map(worker, range(THREADS)) for item in opened]
+    finally:
+        sys.setswitchinterval(interval)
+    
+    assert len(results) == THREADS * ROUNDS
+    assert [(kind, TYPES[kind]) for kind, _ in results] == results
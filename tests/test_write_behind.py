@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("ldt")
+
+from core.service.write_behind import WriteBehind  # noqa: E402
+
+
+class FakeStore:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.syncs = 0
+        self.gate = threading.Event()
+        self.gate.set()
+    
+    def sync(self):
+        self.gate.wait(5)
+        self.syncs += 1
+        if self.fail:
+            raise OSError("disk full")
+
+
+def settle(qapp, writer, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if writer._future is None and not writer._timer.isActive():
+            return
+        time.sleep(0.005)
+
+
+def test_late_result_does_not_clear_a_newer_write(qapp):
+    store = FakeStore()
+    writer = WriteBehind(store, "fake", delay=0)
+    store.gate.clear()
+    writer.schedule("a")
+    writer._flush()
+    threading.Timer(0.05, store.gate.set).start()
+    writer.flush()
+    
+    store.gate.clear()
+    writer.schedule("b")
+    writer._flush()
+    newer = writer._future
+    assert newer is not None
+    # delivers the first write's queued result
+    qapp.processEvents()
+    assert writer._future is newer
+    
+    store.gate.set()
+    settle(qapp, writer)
+    assert writer._future is None
+    assert store.syncs == 3
+
+
+def test_failed_writes_stop_after_the_retries(qapp):
+    store = FakeStore(fail=True)
+    writer = WriteBehind(store, "fake", delay=0)
+    writer.schedule("a")
+    writer._flush()
+    settle(qapp, writer)
+    
+    assert store.syncs == writer.retries + 1
+    assert writer.stats()["failures"] == writer.retries + 1
+    assert writer.pending
+    
+    store.fail = False
+    writer.schedule("b")
+    settle(qapp, writer)
+    assert not writer.pending
+    assert writer.stats()["failures"] == 0